@@ -35,6 +35,10 @@ class AssessmentContent:
     def __init__(self):
         self.sections = self._load_assessment_sections()
         self.questions_by_id = self._build_question_index()
+        self.sections_by_id = {section.id: section for section in self.sections}
+        self.question_ids_by_section = {
+            section.id: frozenset(q.id for q in section.questions) for section in self.sections
+        }
     
     def _load_assessment_sections(self) -> List[AssessmentSection]:
         """Load all assessment sections and questions"""
@@ -415,10 +419,7 @@ class AssessmentContent:
     
     def get_section(self, section_id: str) -> Optional[AssessmentSection]:
         """Get a section by ID"""
-        for section in self.sections:
-            if section.id == section_id:
-                return section
-        return None
+        return self.sections_by_id.get(section_id)
     
     def get_question(self, question_id: str) -> Optional[Question]:
         """Get a question by ID"""
@@ -442,7 +443,7 @@ class AssessmentContent:
             return False, [f"Invalid section ID: {section_id}"]
         
         # Check all questions are answered
-        expected_questions = {q.id for q in section.questions}
+        expected_questions = self.question_ids_by_section[section_id]
         provided_questions = set(responses.keys())
         
         missing = expected_questions - provided_questions
@@ -461,15 +462,19 @@ class AssessmentContent:
         
         return len(errors) == 0, errors
     
-    def create_section_score(self, section_id: str, responses: Dict[str, int]) -> Optional[SectionScore]:
-        """Create a SectionScore object from responses"""
+    def create_section_score(self, section_id: str, responses: Dict[str, int], validate: bool = True) -> Optional[SectionScore]:
+        """Create a SectionScore object from responses
+        
+        Pass validate=False when the responses were already checked with validate_section_responses.
+        """
         section = self.get_section(section_id)
         if not section:
             return None
         
-        is_valid, errors = self.validate_section_responses(section_id, responses)
-        if not is_valid:
-            raise ValueError(f"Invalid responses: {'; '.join(errors)}")
+        if validate:
+            is_valid, errors = self.validate_section_responses(section_id, responses)
+            if not is_valid:
+                raise ValueError(f"Invalid responses: {'; '.join(errors)}")
         
         section_score = SectionScore(
             section_name=section.name,
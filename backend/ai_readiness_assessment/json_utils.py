@@ -0,0 +1,39 @@
+"""
+JSON serialization helpers
+Uses orjson when it is installed and falls back to the standard library json module
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(data: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize data to a JSON string, using orjson when available.
+    
+    default is called for values the encoder cannot serialize, and non-string
+    dict keys are converted to strings, as with json.dumps.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(data, default=default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # OPT_NON_STR_KEYS slows every dict down, so only retry with it when needed
+            return orjson.dumps(data, default=default, option=option | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2 if indent else None, default=default)
+
+
+def json_loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when available.
+    
+    Parse errors raise json.JSONDecodeError (orjson's error type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,10 +3,12 @@ Main Orchestrating Agent for AI Readiness Assessment
 Coordinates all sub-agents and manages the assessment flow
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, AIMessage
 import json
+import threading
+import time
 from datetime import datetime
 
 # Import sub-agent tools
@@ -17,8 +19,8 @@ from .subagents.assessment_guide import (
 )
 from .subagents.scoring_agent import (
     calculate_section_score,
-    determine_readiness_level,
-    validate_section_scores
+    validate_section_scores,
+    _determine_readiness_level_impl
 )
 from .subagents.kenya_context import (
     get_kenya_regulations,
@@ -40,7 +42,8 @@ from .tools import (
     save_assessment_progress,
     load_assessment_progress,
     submit_section_responses,
-    calculate_total_score
+    calculate_total_score,
+    get_assessment_summary
 )
 
 
@@ -78,9 +81,11 @@ class AssessmentOrchestrator:
 
 
 @tool
-def orchestrate_assessment_flow(action: str, data: str = None, assessment_id: str = None) -> str:
+def orchestrate_assessment_flow(action: str, data: Optional[Union[str, Dict[str, Any]]] = None, assessment_id: str = None) -> str:
     """
     Main orchestration tool for managing the complete assessment flow.
+    
+    data may be a JSON string (from agents) or an already-parsed dict (from the API server).
     """
     try:
         orchestrator = AssessmentOrchestrator()
@@ -372,13 +377,11 @@ def _handle_calculate_scores(orchestrator: AssessmentOrchestrator, data: Dict) -
         if not total_score_data.get("success"):
             return total_score_result
         
-        # Determine readiness level
-        readiness_result = determine_readiness_level.invoke({
-            "total_score": total_score_data["total_score"],
-            "section_scores": json.dumps(total_score_data["section_scores"])
-        })
-        
-        readiness_data = json.loads(readiness_result)
+        # Determine readiness level; the section scores are already parsed, so skip the tool's JSON round trip
+        readiness_data = _determine_readiness_level_impl(
+            total_score_data["total_score"],
+            total_score_data["section_scores"]
+        )
         
         # Combine results
         final_results = {
@@ -808,28 +811,51 @@ def get_available_actions() -> str:
     }, indent=2)
 
 
+# Health check results are reused for this many seconds, so concurrent probes share one run
+_HEALTH_CHECK_TTL = 1.0
+_health_check_cache = {"checked_at": 0.0, "result": None}
+_health_check_lock = threading.Lock()
+
+
 @tool
-def health_check() -> str:
+def health_check(force: bool = False) -> str:
     """
     Perform health check on all sub-agents and core systems.
     
+    Args:
+        force: Run the checks even if a result from the last second is available
+    
     Returns:
         JSON string with health status of all components
     """
+    # Holding the lock while checking lets callers that arrive mid-run reuse its result
+    with _health_check_lock:
+        cached = _health_check_cache["result"]
+        if not force and cached is not None and time.monotonic() - _health_check_cache["checked_at"] < _HEALTH_CHECK_TTL:
+            return cached
+        
+        result = _run_health_checks()
+        _health_check_cache["checked_at"] = time.monotonic()
+        _health_check_cache["result"] = result
+        return result
+
+
+def _run_health_checks() -> str:
+    """Run a minimal call against each sub-agent and core tool and collect their status"""
     health_status = {
         "overall_status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "components": {}
     }
     
-    # Test each sub-agent
+    # Test each sub-agent with a read-only call that needs no LLM round-trip
     components_to_test = [
         ("assessment_guide", get_question_explanation),
         ("scoring_agent", calculate_section_score),
         ("kenya_context", get_kenya_regulations),
-        ("recommendation_agent", generate_personalized_recommendations),
+        ("recommendation_agent", get_recommendation_templates),
         ("report_generator", generate_comprehensive_report),
-        ("core_tools", start_assessment)
+        ("core_tools", get_assessment_summary)
     ]
     
     for component_name, test_tool in components_to_test:
@@ -850,8 +876,7 @@ def health_check() -> str:
                 })
             elif component_name == "recommendation_agent":
                 result = test_tool.invoke({
-                    "assessment_results": '{"total_score": 50, "readiness_level": "Foundation Building"}',
-                    "business_info": "{}"
+                    "readiness_level": "Foundation Building"
                 })
             elif component_name == "report_generator":
                 result = test_tool.invoke({
@@ -860,11 +885,7 @@ def health_check() -> str:
                     "business_info": "{}"
                 })
             elif component_name == "core_tools":
-                result = test_tool.invoke({
-                    "user_id": "test_user",
-                    "business_name": "Test Business",
-                    "industry": "General"
-                })
+                result = test_tool.invoke({})
             
             # Check if result indicates success
             try:
@@ -111,6 +111,10 @@ class AssessmentState(BaseModel):
         else:
             return "🔵 AI Advanced"
 
+# Valid question scores (1-5), shared by the validation helpers
+VALID_SCORES = frozenset(range(1, 6))
+
+
 # Validation functions
 def validate_assessment_data(data: dict) -> bool:
     """Validate assessment data structure"""
@@ -147,14 +151,8 @@ def validate_section_responses(section_id: str, responses: dict) -> bool:
         if not isinstance(responses, dict):
             return False
         
-        # Check score ranges (1-5)
-        for question_id, score in responses.items():
-            if not isinstance(score, int):
-                return False
-            if score < 1 or score > 5:
-                return False
-        
-        return True
+        # Check score types and ranges (1-5), stopping at the first invalid score
+        return all(isinstance(score, int) and score in VALID_SCORES for score in responses.values())
         
     except Exception:
         return False
\ No newline at end of file
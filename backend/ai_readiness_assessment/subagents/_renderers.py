@@ -0,0 +1,244 @@
+"""
+Report rendering helpers
+Plain Markdown, HTML and PDF-data exporters used by the report generator agent
+"""
+
+from typing import Dict, List, Any, Mapping, TextIO
+from collections import ChainMap
+from itertools import starmap
+from html import escape
+
+from ..json_utils import json_dumps
+
+# Per-item line templates shared by the Markdown and HTML exporters
+_MD_FINDING_LINE = "- {}\n"
+_MD_PRIORITY_LINE = "{}. {}\n"
+_MD_SECTION_LINES = (
+    "\n### {section_name}\n"
+    "**Score:** {score}/{score_max} ({percentage:.1f}%) - {status}\n"
+    "**Priority:** {priority_level}\n"
+)
+# Older reports carry preformatted "12/25" scores and "48.0%" percentages and no score_max
+_MD_LEGACY_SECTION_LINES = (
+    "\n### {section_name}\n"
+    "**Score:** {score} ({percentage}) - {status}\n"
+    "**Priority:** {priority_level}\n"
+)
+_MD_ACTION_LINE = "{priority}. {action} (Timeline: {timeline})\n"
+_HTML_FINDING_LINE = "            <li>{}</li>\n"
+_HTML_PRIORITY_LINE = '            <li class="priority">{}</li>\n'
+
+
+def _render_lines(line_template: str, items) -> str:
+    """Render each item into a positional line template and join the lines"""
+    return "".join(map(line_template.format, items))
+
+
+def _render_records(line_template: str, records) -> str:
+    """Render each dict record into a named-field line template and join the lines"""
+    return "".join(map(line_template.format_map, records))
+
+
+def _escape_text(value: Any) -> str:
+    """Convert a value to HTML-escaped text"""
+    return escape(str(value))
+
+
+# Export results returned when the report payload is not a successful report
+_MD_ERROR = "# Error\nFailed to generate report"
+_HTML_ERROR = "<html><body><h1>Error</h1><p>Failed to generate report</p></body></html>"
+_PDF_ERROR_JSON = json_dumps({"error": "Failed to generate report"})
+
+_MD_TEMPLATE = """# {report_title}
+
+**Organization:** {organization}  
+**Industry:** {industry}  
+**Assessment Date:** {assessment_date}  
+**Location:** {location}
+
+## Executive Summary
+
+**Overall Readiness Level:** {overall_readiness}  
+**Total Score:** {total_score}  
+**Estimated Timeline:** {estimated_timeline}
+
+### Key Findings
+{key_findings_block}
+### Critical Priorities
+{critical_priorities_block}
+## Section Analysis
+{section_analysis_block}
+## Immediate Actions
+{immediate_actions_block}"""
+
+
+def _flatten_for_md(report_data: Dict) -> Mapping[str, Any]:
+    """Build the placeholder context used by _MD_TEMPLATE.
+    
+    Metadata and summary fields are looked up in place through a ChainMap rather than copied.
+    """
+    metadata = report_data["report_metadata"]
+    summary = report_data["executive_summary"]
+    
+    blocks = {
+        "key_findings_block": _md_key_findings(summary["key_findings"]),
+        "critical_priorities_block": _md_critical_priorities(summary["critical_priorities"]),
+        "section_analysis_block": _md_section_analysis(report_data["section_analysis"]),
+        "immediate_actions_block": _md_immediate_actions(report_data["immediate_actions"])
+    }
+    
+    return ChainMap(blocks, metadata, summary)
+
+
+def _md_key_findings(findings: List[str]) -> str:
+    """Render key findings as a Markdown bullet list"""
+    return _render_lines(_MD_FINDING_LINE, findings)
+
+
+def _md_critical_priorities(priorities: List[str]) -> str:
+    """Render critical priorities as a numbered Markdown list"""
+    return "".join(starmap(_MD_PRIORITY_LINE.format, enumerate(priorities, 1)))
+
+
+def _md_section_lines(section: Dict) -> str:
+    """Render one section analysis block, accepting the older preformatted score fields"""
+    template = _MD_SECTION_LINES if "score_max" in section else _MD_LEGACY_SECTION_LINES
+    return template.format_map(section)
+
+
+def _md_section_analysis(sections: List[Dict]) -> str:
+    """Render the per-section analysis blocks"""
+    return "".join(map(_md_section_lines, sections))
+
+
+def _md_immediate_actions(actions: List[Dict]) -> str:
+    """Render immediate actions as a numbered Markdown list"""
+    return _render_records(_MD_ACTION_LINE, actions)
+
+
+def _export_markdown(report: Dict) -> str:
+    """Export report as Markdown"""
+    if not report.get("success"):
+        return _MD_ERROR
+    
+    return _MD_TEMPLATE.format_map(_flatten_for_md(report["report"]))
+
+
+_MD_REPORT_SEPARATOR = "\n\n---\n\n"
+
+
+def _export_markdown_many(reports: List[Dict], out: TextIO) -> None:
+    """Write several reports as Markdown to an open text stream.
+    
+    Reports are rendered and written one at a time, so only a single rendered report is
+    held in memory regardless of batch size.
+    """
+    for index, report in enumerate(reports):
+        if index:
+            out.write(_MD_REPORT_SEPARATOR)
+        out.write(_export_markdown(report))
+
+
+# Static stylesheet, substituted into the template as a value so it is not re-parsed per render
+_HTML_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background-color: #f8f9fa; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; }
+        .priority { background-color: #fff3cd; padding: 10px; border-radius: 3px; }
+        .score { font-weight: bold; color: #007bff; }
+    </style>"""
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>{report_title}</title>
+{style}
+</head>
+<body>
+    <div class="header">
+        <h1>{report_title}</h1>
+        <p><strong>Organization:</strong> {organization}</p>
+        <p><strong>Industry:</strong> {industry}</p>
+        <p><strong>Assessment Date:</strong> {assessment_date}</p>
+    </div>
+    
+    <div class="section">
+        <h2>Executive Summary</h2>
+        <p><strong>Overall Readiness Level:</strong> <span class="score">{overall_readiness}</span></p>
+        <p><strong>Total Score:</strong> {total_score}</p>
+        <p><strong>Estimated Timeline:</strong> {estimated_timeline}</p>
+        
+        <h3>Key Findings</h3>
+        <ul>
+{key_findings_items}        </ul>
+        
+        <h3>Critical Priorities</h3>
+        <ol>
+{critical_priorities_items}        </ol>
+    </div>
+</body>
+</html>"""
+
+
+def _flatten_for_html(report_data: Dict) -> Dict[str, str]:
+    """Flatten report data into the placeholder context used by _HTML_TEMPLATE, escaping all values"""
+    metadata = report_data["report_metadata"]
+    summary = report_data["executive_summary"]
+    
+    return {
+        "style": _HTML_STYLE,
+        "report_title": _escape_text(metadata["report_title"]),
+        "organization": _escape_text(metadata["organization"]),
+        "industry": _escape_text(metadata["industry"]),
+        "assessment_date": _escape_text(metadata["assessment_date"]),
+        "overall_readiness": _escape_text(summary["overall_readiness"]),
+        "total_score": _escape_text(summary["total_score"]),
+        "estimated_timeline": _escape_text(summary["estimated_timeline"]),
+        "key_findings_items": _html_key_findings(summary["key_findings"]),
+        "critical_priorities_items": _html_critical_priorities(summary["critical_priorities"])
+    }
+
+
+def _html_key_findings(findings: List[str]) -> str:
+    """Render key findings as HTML list items"""
+    return _render_lines(_HTML_FINDING_LINE, map(_escape_text, findings))
+
+
+def _html_critical_priorities(priorities: List[str]) -> str:
+    """Render critical priorities as HTML list items"""
+    return _render_lines(_HTML_PRIORITY_LINE, map(_escape_text, priorities))
+
+
+def _export_html(report: Dict) -> str:
+    """Export report as HTML"""
+    if not report.get("success"):
+        return _HTML_ERROR
+    
+    return _HTML_TEMPLATE.format_map(_flatten_for_html(report["report"]))
+
+
+# (section title, report key) pairs emitted in order by the PDF data export
+_PDF_SECTIONS = (
+    ("Executive Summary", "executive_summary"),
+    ("Assessment Overview", "assessment_overview"),
+    ("Section Analysis", "section_analysis"),
+    ("Immediate Actions", "immediate_actions"),
+    ("Implementation Roadmap", "implementation_roadmap")
+)
+
+
+def _export_pdf_data(report: Dict) -> str:
+    """Export report data formatted for PDF generation"""
+    if not report.get("success"):
+        return _PDF_ERROR_JSON
+    
+    report_data = report["report"]
+    metadata = report_data["report_metadata"]
+    
+    # Return structured data that can be used by PDF generation libraries
+    return json_dumps({
+        "title": metadata["report_title"],
+        "metadata": metadata,
+        "sections": [{"title": title, "content": report_data[key]} for title, key in _PDF_SECTIONS],
+        "charts": report_data["visual_representations"]
+    })
@@ -3,10 +3,27 @@ Report Generator Agent Sub-agent
 Generates comprehensive assessment reports with visual representations
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from langchain_core.tools import tool
 import json
 from datetime import datetime
+from ..json_utils import json_dumps, json_loads
+from ._renderers import _export_markdown, _export_html, _export_pdf_data
+
+
+@dataclass(slots=True)
+class SectionAnalysis:
+    """Analysis record for a single assessment section"""
+    section_name: str
+    score: int
+    score_max: int
+    percentage: float
+    status: str
+    key_strengths: List[str]
+    improvement_areas: List[str]
+    priority_level: str
 
 
 @tool
@@ -23,17 +40,32 @@ def generate_comprehensive_report(assessment_results: str, recommendations: str,
         JSON string with complete formatted report
     """
     try:
-        # Parse input data
-        results = json.loads(assessment_results)
-        recs = json.loads(recommendations)
-        business_data = json.loads(business_info) if business_info else {}
+        # Parse and validate input data before building any section
+        try:
+            results = json_loads(assessment_results)
+        except json.JSONDecodeError:
+            return json_dumps({"success": False, "error": "Invalid JSON format for assessment results"})
+        
+        try:
+            recs = json_loads(recommendations)
+        except json.JSONDecodeError:
+            return json_dumps({"success": False, "error": "Invalid JSON format for recommendations"})
+        
+        try:
+            business_data = json_loads(business_info) if business_info else {}
+        except json.JSONDecodeError:
+            return json_dumps({"success": False, "error": "Invalid JSON format for business info"})
+        
+        input_error = _validate_report_inputs(results, recs, business_data)
+        if input_error:
+            return json_dumps({"success": False, "error": input_error})
         
         # Generate report sections
         report = {
             "report_metadata": _create_report_metadata(business_data),
             "executive_summary": _create_executive_summary(results, recs),
             "assessment_overview": _create_assessment_overview(results),
-            "section_analysis": _create_section_analysis(results),
+            "section_analysis": [asdict(section) for section in _create_section_analysis(results)],
             "readiness_level_details": _create_readiness_details(results, recs),
             "immediate_actions": _extract_immediate_actions(recs),
             "short_term_goals": _extract_short_term_goals(recs),
@@ -47,14 +79,29 @@ def generate_comprehensive_report(assessment_results: str, recommendations: str,
             "appendices": _create_appendices(results, recs)
         }
         
-        return json.dumps({
+        return json_dumps({
             "success": True,
             "report": report,
             "generated_at": datetime.now().isoformat()
-        }, indent=2)
+        }, indent=True)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to generate report: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to generate report: {str(e)}"})
+
+
+def _validate_report_inputs(results: Any, recommendations: Any, business_data: Any) -> Optional[str]:
+    """Check the shape of parsed report inputs, returning an error message if invalid"""
+    if not isinstance(results, dict):
+        return "Assessment results must be a JSON object"
+    if not isinstance(results.get("section_scores", {}), dict):
+        return "Assessment results section_scores must be a JSON object"
+    if not isinstance(recommendations, dict):
+        return "Recommendations must be a JSON object"
+    if not isinstance(recommendations.get("recommendations", {}), dict):
+        return "Recommendations must contain a recommendations object"
+    if not isinstance(business_data, dict):
+        return "Business info must be a JSON object"
+    return None
 
 
 def _create_report_metadata(business_data: Dict) -> Dict[str, Any]:
@@ -139,7 +186,7 @@ def _calculate_score_distribution(section_scores: Dict) -> Dict[str, int]:
     return distribution
 
 
-def _create_section_analysis(results: Dict) -> List[Dict[str, Any]]:
+def _create_section_analysis(results: Dict) -> List[SectionAnalysis]:
     """Create detailed section analysis"""
     section_names = {
         "data_infrastructure": "Data Infrastructure & Quality",
@@ -160,17 +207,18 @@ def _create_section_analysis(results: Dict) -> List[Dict[str, Any]]:
             max_score = section_data.get("max_possible", 25)
             percentage = (score / max_score * 100) if max_score > 0 else 0
             
-            analysis.append({
-                "section_name": section_name,
-                "score": f"{score}/{max_score}",
-                "percentage": f"{percentage:.1f}%",
-                "status": _get_section_status_label(percentage),
-                "key_strengths": _identify_section_strengths(section_data, section_key),
-                "improvement_areas": _identify_improvement_areas(section_data, section_key),
-                "priority_level": _determine_section_priority(percentage)
-            })
+            analysis.append(SectionAnalysis(
+                section_name=section_name,
+                score=score,
+                score_max=max_score,
+                percentage=round(percentage, 1),
+                status=_get_section_status_label(percentage),
+                key_strengths=_identify_section_strengths(section_data, section_key),
+                improvement_areas=_identify_improvement_areas(section_data, section_key),
+                priority_level=_determine_section_priority(percentage)
+            ))
     
-    return sorted(analysis, key=lambda x: float(x["percentage"].rstrip("%")))
+    return sorted(analysis, key=lambda x: x.percentage)
 
 
 def _get_section_status_label(percentage: float) -> str:
@@ -376,58 +424,98 @@ def _get_level_success_indicators(readiness_level: str) -> List[str]:
     return indicators.get(readiness_level, indicators["Not Ready"])
 
 
-def _extract_immediate_actions(recommendations: Dict) -> List[Dict[str, Any]]:
-    """Extract immediate actions from recommendations"""
-    immediate = recommendations.get("recommendations", {}).get("immediate_actions", [])
-    
-    actions = []
-    for i, action in enumerate(immediate[:5], 1):  # Limit to top 5
-        actions.append({
-            "priority": i,
-            "action": action,
-            "timeline": "1-4 weeks",
-            "owner": "Leadership Team",
-            "resources_needed": "Internal resources",
-            "success_criteria": f"Completion of {action.lower()}"
-        })
+_IMMEDIATE_ACTION_TEMPLATE = {
+    "priority": 0,
+    "action": "",
+    "timeline": "1-4 weeks",
+    "owner": "Leadership Team",
+    "resources_needed": "Internal resources",
+    "success_criteria": ""
+}
+
+_SHORT_TERM_GOAL_TEMPLATE = {
+    "goal": "",
+    "timeline": "1-6 months",
+    "success_metrics": "",
+    "dependencies": "Completion of immediate actions",
+    "estimated_effort": "Medium",
+    "expected_outcome": ""
+}
+
+_LONG_TERM_VISION_TEMPLATE = {
+    "vision_element": "",
+    "timeline": "6-24 months",
+    "strategic_impact": "High",
+    "success_indicators": "",
+    "business_value": "Significant competitive advantage",
+    "sustainability": "Long-term organizational capability"
+}
+
+_SUCCESS_METRIC_TEMPLATE = {
+    "metric": "",
+    "measurement_method": "Quantitative assessment",
+    "target": "Improvement over baseline",
+    "frequency": "Monthly review",
+    "owner": "Project team"
+}
+
+
+def _extract_typed_list(recommendations: Dict, source_key: str, template: Dict[str, Any],
+                        limit: int,
+                        derive_fields: Callable[[Dict[str, Any], str, int], None]) -> List[Dict[str, Any]]:
+    """Build report entries from a recommendations list using a field template"""
+    items = recommendations.get("recommendations", {}).get(source_key, [])[:limit]
     
-    return actions
+    entries = []
+    for position, item in enumerate(items, 1):
+        entry = dict(template)
+        derive_fields(entry, item, position)
+        entries.append(entry)
+    
+    return entries
+
+
+def _derive_immediate_action(entry: Dict, action: str, position: int) -> None:
+    """Fill per-item fields of an immediate action entry"""
+    entry["priority"] = position
+    entry["action"] = action
+    entry["success_criteria"] = f"Completion of {action.lower()}"
+
+
+def _derive_short_term_goal(entry: Dict, goal: str, position: int) -> None:
+    """Fill per-item fields of a short-term goal entry"""
+    entry["goal"] = goal
+    entry["success_metrics"] = f"Measurable progress in {goal.lower()}"
+    entry["expected_outcome"] = f"Improved capability in {goal.lower()}"
+
+
+def _derive_long_term_vision(entry: Dict, item: str, position: int) -> None:
+    """Fill per-item fields of a long-term vision entry"""
+    entry["vision_element"] = item
+    entry["success_indicators"] = f"Achievement of {item.lower()}"
+
+
+def _derive_success_metric(entry: Dict, metric: str, position: int) -> None:
+    """Fill per-item fields of a success metric entry"""
+    entry["metric"] = metric
+
+
+def _extract_immediate_actions(recommendations: Dict) -> List[Dict[str, Any]]:
+    """Extract immediate actions from recommendations (top 5)"""
+    return _extract_typed_list(recommendations, "immediate_actions", _IMMEDIATE_ACTION_TEMPLATE,
+                               5, _derive_immediate_action)
 
 
 def _extract_short_term_goals(recommendations: Dict) -> List[Dict[str, Any]]:
-    """Extract short-term goals from recommendations"""
-    short_term = recommendations.get("recommendations", {}).get("short_term_goals", [])
-    
-    goals = []
-    for i, goal in enumerate(short_term[:5], 1):
-        goals.append({
-            "goal": goal,
-            "timeline": "1-6 months",
-            "success_metrics": f"Measurable progress in {goal.lower()}",
-            "dependencies": "Completion of immediate actions",
-            "estimated_effort": "Medium",
-            "expected_outcome": f"Improved capability in {goal.lower()}"
-        })
-    
-    return goals
+    """Extract short-term goals from recommendations (top 5)"""
+    return _extract_typed_list(recommendations, "short_term_goals", _SHORT_TERM_GOAL_TEMPLATE,
+                               5, _derive_short_term_goal)
 
 
 def _extract_long_term_vision(recommendations: Dict) -> List[Dict[str, Any]]:
-    """Extract long-term vision from recommendations"""
-    long_term = recommendations.get("recommendations", {}).get("long_term_vision", [])
-    
-    vision = []
-    for i, item in enumerate(long_term[:3], 1):
-        vision.append({
-            "vision_element": item,
-            "timeline": "6-24 months",
-            "strategic_impact": "High",
-            "success_indicators": f"Achievement of {item.lower()}",
-            "business_value": "Significant competitive advantage",
-            "sustainability": "Long-term organizational capability"
-        })
-    
-    return vision
+    """Extract long-term vision from recommendations (top 3)"""
+    return _extract_typed_list(recommendations, "long_term_vision", _LONG_TERM_VISION_TEMPLATE,
+                               3, _derive_long_term_vision)
 
 
 def _create_implementation_roadmap(recommendations: Dict) -> Dict[str, Any]:
@@ -508,20 +596,9 @@ def _extract_risk_assessment(recommendations: Dict) -> Dict[str, Any]:
 
 
 def _extract_success_metrics(recommendations: Dict) -> List[Dict[str, Any]]:
-    """Extract success metrics"""
-    metrics = recommendations.get("recommendations", {}).get("success_metrics", [])
-    
-    formatted_metrics = []
-    for metric in metrics[:8]:  # Limit to 8 metrics
-        formatted_metrics.append({
-            "metric": metric,
-            "measurement_method": "Quantitative assessment",
-            "target": "Improvement over baseline",
-            "frequency": "Monthly review",
-            "owner": "Project team"
-        })
-    
-    return formatted_metrics
+    """Extract success metrics (limited to 8)"""
+    return _extract_typed_list(recommendations, "success_metrics", _SUCCESS_METRIC_TEMPLATE,
+                               8, _derive_success_metric)
 
 
 def _extract_kenya_guidance(recommendations: Dict) -> Dict[str, Any]:
@@ -771,7 +848,7 @@ def export_report_format(report_data: str, format_type: str = "json") -> str:
         Formatted report string or JSON with export data
     """
     try:
-        report = json.loads(report_data)
+        report = json_loads(report_data)
         
         if format_type == "markdown":
             return _export_markdown(report)
@@ -780,153 +857,28 @@ def export_report_format(report_data: str, format_type: str = "json") -> str:
         elif format_type == "pdf_data":
             return _export_pdf_data(report)
         else:
-            return json.dumps(report, indent=2)
+            return json_dumps(report, indent=True)
             
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Export failed: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Export failed: {str(e)}"})
 
 
-def _export_markdown(report: Dict) -> str:
-    """Export report as Markdown"""
-    if not report.get("success"):
-        return "# Error\nFailed to generate report"
+@lru_cache(maxsize=16)
+def _parse_chart_results(assessment_results: str) -> Dict[str, Any]:
+    """Parse assessment results for chart building, reusing the result for repeated payloads.
     
-    report_data = report["report"]
-    metadata = report_data["report_metadata"]
-    summary = report_data["executive_summary"]
-    
-    markdown = f"""# {metadata["report_title"]}
-
-**Organization:** {metadata["organization"]}  
-**Industry:** {metadata["industry"]}  
-**Assessment Date:** {metadata["assessment_date"]}  
-**Location:** {metadata["location"]}
-
-## Executive Summary
-
-**Overall Readiness Level:** {summary["overall_readiness"]}  
-**Total Score:** {summary["total_score"]}  
-**Estimated Timeline:** {summary["estimated_timeline"]}
-
-### Key Findings
-"""
-    
-    for finding in summary["key_findings"]:
-        markdown += f"- {finding}\n"
-    
-    markdown += "\n### Critical Priorities\n"
-    for i, priority in enumerate(summary["critical_priorities"], 1):
-        markdown += f"{i}. {priority}\n"
-    
-    # Add section analysis
-    markdown += "\n## Section Analysis\n"
-    for section in report_data["section_analysis"]:
-        markdown += f"\n### {section['section_name']}\n"
-        markdown += f"**Score:** {section['score']} ({section['percentage']}) - {section['status']}\n"
-        markdown += f"**Priority:** {section['priority_level']}\n"
-    
-    # Add immediate actions
-    markdown += "\n## Immediate Actions\n"
-    for action in report_data["immediate_actions"]:
-        markdown += f"{action['priority']}. {action['action']} (Timeline: {action['timeline']})\n"
-    
-    return markdown
-
-
-def _export_html(report: Dict) -> str:
-    """Export report as HTML"""
-    if not report.get("success"):
-        return "<html><body><h1>Error</h1><p>Failed to generate report</p></body></html>"
-    
-    report_data = report["report"]
-    metadata = report_data["report_metadata"]
-    summary = report_data["executive_summary"]
-    
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{metadata["report_title"]}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; }}
-        .section {{ margin: 20px 0; }}
-        .priority {{ background-color: #fff3cd; padding: 10px; border-radius: 3px; }}
-        .score {{ font-weight: bold; color: #007bff; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{metadata["report_title"]}</h1>
-        <p><strong>Organization:</strong> {metadata["organization"]}</p>
-        <p><strong>Industry:</strong> {metadata["industry"]}</p>
-        <p><strong>Assessment Date:</strong> {metadata["assessment_date"]}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Executive Summary</h2>
-        <p><strong>Overall Readiness Level:</strong> <span class="score">{summary["overall_readiness"]}</span></p>
-        <p><strong>Total Score:</strong> {summary["total_score"]}</p>
-        <p><strong>Estimated Timeline:</strong> {summary["estimated_timeline"]}</p>
-        
-        <h3>Key Findings</h3>
-        <ul>
-"""
-    
-    for finding in summary["key_findings"]:
-        html += f"            <li>{finding}</li>\n"
-    
-    html += """        </ul>
-        
-        <h3>Critical Priorities</h3>
-        <ol>
-"""
-    
-    for priority in summary["critical_priorities"]:
-        html += f'            <li class="priority">{priority}</li>\n'
-    
-    html += """        </ol>
-    </div>
-</body>
-</html>"""
-    
-    return html
+    The returned dict is shared between calls, so chart builders must treat it as read-only.
+    """
+    return json_loads(assessment_results)
 
 
-def _export_pdf_data(report: Dict) -> str:
-    """Export report data formatted for PDF generation"""
-    if not report.get("success"):
-        return json.dumps({"error": "Failed to generate report"})
-    
-    # Return structured data that can be used by PDF generation libraries
-    pdf_data = {
-        "title": report["report"]["report_metadata"]["report_title"],
-        "metadata": report["report"]["report_metadata"],
-        "sections": [
-            {
-                "title": "Executive Summary",
-                "content": report["report"]["executive_summary"]
-            },
-            {
-                "title": "Assessment Overview", 
-                "content": report["report"]["assessment_overview"]
-            },
-            {
-                "title": "Section Analysis",
-                "content": report["report"]["section_analysis"]
-            },
-            {
-                "title": "Immediate Actions",
-                "content": report["report"]["immediate_actions"]
-            },
-            {
-                "title": "Implementation Roadmap",
-                "content": report["report"]["implementation_roadmap"]
-            }
-        ],
-        "charts": report["report"]["visual_representations"]
-    }
-    
-    return json.dumps(pdf_data, indent=2)
+_CHART_BUILDERS = {
+    "radar": lambda results: _create_radar_chart_data(results.get("section_scores", {})),
+    "bar": lambda results: _create_bar_chart_data(results.get("section_scores", {})),
+    "gauge": _create_gauge_data,
+    "timeline": _create_timeline_data,
+    "comparison": lambda results: _create_comparison_data(results.get("section_scores", {}))
+}
 
 
 @tool
@@ -942,26 +894,17 @@ def create_visual_chart_data(assessment_results: str, chart_type: str) -> str:
         JSON string with chart-specific data
     """
     try:
-        results = json.loads(assessment_results)
+        build_chart = _CHART_BUILDERS.get(chart_type)
+        if build_chart is None:
+            return json_dumps({"success": False, "error": f"Unknown chart type: {chart_type}"})
         
-        if chart_type == "radar":
-            chart_data = _create_radar_chart_data(results.get("section_scores", {}))
-        elif chart_type == "bar":
-            chart_data = _create_bar_chart_data(results.get("section_scores", {}))
-        elif chart_type == "gauge":
-            chart_data = _create_gauge_data(results)
-        elif chart_type == "timeline":
-            chart_data = _create_timeline_data(results)
-        elif chart_type == "comparison":
-            chart_data = _create_comparison_data(results.get("section_scores", {}))
-        else:
-            return json.dumps({"success": False, "error": f"Unknown chart type: {chart_type}"})
+        chart_data = build_chart(_parse_chart_results(assessment_results))
         
-        return json.dumps({
+        return json_dumps({
             "success": True,
             "chart_type": chart_type,
             "data": chart_data
-        }, indent=2)
+        }, indent=True)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to create chart data: {str(e)}"})
\ No newline at end of file
+        return json_dumps({"success": False, "error": f"Failed to create chart data: {str(e)}"})
\ No newline at end of file
@@ -3,18 +3,49 @@ Scoring Agent Sub-agent
 Handles score calculations, validation, and readiness level determination
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from langchain_core.tools import tool
 import json
 import statistics
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 
 from ..content import AssessmentContent
-from ..models import SectionScore, AssessmentState
+from ..json_utils import json_dumps, json_loads
+from ..models import SectionScore, AssessmentState, VALID_SCORES
 
 
 # Global content instance for sub-agent
 _content = AssessmentContent()
 
+@dataclass(slots=True)
+class SectionComparison:
+    """Comparison record for a single section against its benchmark"""
+    section_id: str
+    current_score: int
+    current_percentage: float
+    benchmark_score: Optional[int] = None
+    benchmark_percentage: Optional[float] = None
+    change: Optional[int] = None
+    percentage_change: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a result entry, leaving out the benchmark fields when there is no benchmark"""
+        data = asdict(self)
+        if self.benchmark_score is None:
+            for key in ("benchmark_score", "benchmark_percentage", "change", "percentage_change"):
+                del data[key]
+        return data
+
+
+# Tool results are consumed by agents, so they are emitted as compact JSON;
+# set to True to get indented output when debugging
+PRETTY_OUTPUT = False
+
 
 @tool
 def validate_section_scores(section_id: str, responses: str) -> str:
@@ -31,42 +62,45 @@ def validate_section_scores(section_id: str, responses: str) -> str:
     try:
         # Parse responses
         try:
-            response_dict = json.loads(responses)
+            response_dict = json_loads(responses)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for responses"})
-        
-        # Convert to proper format
-        processed_responses = {}
-        for key, value in response_dict.items():
-            if not isinstance(value, int):
-                return json.dumps({"success": False, "error": f"Score for question {key} must be an integer, got {type(value).__name__}"})
-            processed_responses[str(key)] = int(value)
-        
-        # Validate using content system
-        is_valid, errors = _content.validate_section_responses(section_id, processed_responses)
-        
-        section = _content.get_section(section_id)
-        if not section:
-            return json.dumps({"success": False, "error": f"Section {section_id} not found"})
-        
-        result = {
-            "success": True,
-            "validation_passed": is_valid,
-            "section": {
-                "id": section_id,
-                "name": section.name,
-                "expected_questions": len(section.questions),
-                "provided_responses": len(processed_responses)
-            },
-            "errors": errors if not is_valid else [],
-            "score_analysis": _analyze_section_scores(section_id, processed_responses) if is_valid else None,
-            "recommendations": _get_score_recommendations(section_id, processed_responses) if is_valid else []
-        }
+            return json_dumps({"success": False, "error": "Invalid JSON format for responses"})
         
-        return json.dumps(result, indent=2)
+        return json_dumps(_validate_section_scores_impl(section_id, response_dict), indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to validate section scores: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to validate section scores: {str(e)}"})
+
+
+def _validate_section_scores_impl(section_id: str, response_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate already-parsed section responses; shared by the tool and programmatic callers"""
+    # Convert to proper format
+    processed_responses = {}
+    for key, value in response_dict.items():
+        if not isinstance(value, int):
+            return {"success": False, "error": f"Score for question {key} must be an integer, got {type(value).__name__}"}
+        processed_responses[str(key)] = int(value)
+    
+    # Validate using content system
+    is_valid, errors = _content.validate_section_responses(section_id, processed_responses)
+    
+    section = _content.get_section(section_id)
+    if not section:
+        return {"success": False, "error": f"Section {section_id} not found"}
+    
+    return {
+        "success": True,
+        "validation_passed": is_valid,
+        "section": {
+            "id": section_id,
+            "name": section.name,
+            "expected_questions": len(section.questions),
+            "provided_responses": len(processed_responses)
+        },
+        "errors": errors if not is_valid else [],
+        "score_analysis": _analyze_section_scores(section_id, processed_responses) if is_valid else None,
+        "recommendations": _get_score_recommendations(section_id, processed_responses) if is_valid else []
+    }
 
 
 @tool
@@ -82,63 +116,58 @@ def calculate_section_score(section_id: str, responses: str) -> str:
         JSON string with detailed scoring analysis
     """
     try:
-        # Parse and validate responses
+        # Parse responses
         try:
-            response_dict = json.loads(responses)
+            response_dict = json_loads(responses)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for responses"})
-        
-        processed_responses = {}
-        for key, value in response_dict.items():
-            processed_responses[str(key)] = int(value)
-        
-        # Validate responses
-        is_valid, errors = _content.validate_section_responses(section_id, processed_responses)
-        if not is_valid:
-            return json.dumps({"success": False, "error": "Validation failed", "errors": errors})
-        
-        # Create section score
-        section_score = _content.create_section_score(section_id, processed_responses)
-        section = _content.get_section(section_id)
-        
-        # Calculate detailed statistics
-        scores = list(processed_responses.values())
-        score_stats = {
-            "mean": round(statistics.mean(scores), 2),
-            "median": statistics.median(scores),
-            "mode": statistics.mode(scores) if len(set(scores)) < len(scores) else None,
-            "min": min(scores),
-            "max": max(scores),
-            "range": max(scores) - min(scores),
-            "std_dev": round(statistics.stdev(scores), 2) if len(scores) > 1 else 0
-        }
-        
-        # Calculate percentages and performance levels
-        percentage = (section_score.section_total / section_score.max_possible) * 100
-        performance_level = _get_performance_level(percentage)
+            return json_dumps({"success": False, "error": "Invalid JSON format for responses"})
         
-        result = {
-            "success": True,
-            "section_score": {
-                "section_id": section_id,
-                "section_name": section_score.section_name,
-                "total_score": section_score.section_total,
-                "max_possible": section_score.max_possible,
-                "percentage": round(percentage, 1),
-                "performance_level": performance_level,
-                "individual_scores": section_score.questions
-            },
-            "statistics": score_stats,
-            "score_distribution": _get_score_distribution(scores),
-            "strengths": _identify_strengths(processed_responses),
-            "weaknesses": _identify_improvement_areas(processed_responses),
-            "improvement_areas": _identify_improvement_areas(processed_responses)
-        }
-        
-        return json.dumps(result, indent=2)
+        return json_dumps(_calculate_section_score_impl(section_id, response_dict), indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to calculate section score: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to calculate section score: {str(e)}"})
+
+
+def _calculate_section_score_impl(section_id: str, response_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Score already-parsed section responses; shared by the tool and programmatic callers"""
+    processed_responses = {}
+    for key, value in response_dict.items():
+        processed_responses[str(key)] = int(value)
+    
+    # Validate responses
+    is_valid, errors = _content.validate_section_responses(section_id, processed_responses)
+    if not is_valid:
+        return {"success": False, "error": "Validation failed", "errors": errors}
+    
+    # Create section score
+    section_score = _content.create_section_score(section_id, processed_responses, validate=False)
+    
+    # Calculate detailed statistics
+    scores = list(processed_responses.values())
+    score_stats = _get_score_statistics(scores)
+    
+    # Calculate percentages and performance levels
+    percentage = (section_score.section_total / section_score.max_possible) * 100
+    performance_level = _get_performance_level(percentage)
+    improvement_areas = _identify_improvement_areas(processed_responses)
+    
+    return {
+        "success": True,
+        "section_score": {
+            "section_id": section_id,
+            "section_name": section_score.section_name,
+            "total_score": section_score.section_total,
+            "max_possible": section_score.max_possible,
+            "percentage": round(percentage, 1),
+            "performance_level": performance_level,
+            "individual_scores": section_score.questions
+        },
+        "statistics": score_stats,
+        "score_distribution": _get_score_distribution(scores),
+        "strengths": _identify_strengths(processed_responses),
+        "weaknesses": improvement_areas,
+        "improvement_areas": list(improvement_areas)
+    }
 
 
 @tool
@@ -154,45 +183,55 @@ def determine_readiness_level(total_score: int, section_scores: str = None) -> s
         JSON string with readiness level determination and detailed analysis
     """
     try:
-        # Validate total score
-        if not isinstance(total_score, int) or total_score < 0 or total_score > 100:
-            return json.dumps({"success": False, "error": f"Total score must be between 0 and 100, got {total_score}"})
-        
-        # Determine basic readiness level
-        readiness_info = _get_readiness_level_info(total_score)
-        
         # Parse section scores if provided
-        section_analysis = None
+        sections_data = None
         if section_scores:
             try:
-                sections_data = json.loads(section_scores)
-                section_analysis = _analyze_section_performance(sections_data)
-            except (json.JSONDecodeError, Exception) as e:
+                sections_data = json_loads(section_scores)
+            except json.JSONDecodeError:
                 # Continue without section analysis if parsing fails
                 pass
         
-        result = {
-            "success": True,
-            "total_score": total_score,
-            "readiness_level": readiness_info["level"],
-            "readiness_description": readiness_info["description"],
-            "readiness_details": {
-                "category": readiness_info["category"],
-                "score_range": readiness_info["range"],
-                "timeline": readiness_info["timeline"],
-                "approach": readiness_info["approach"]
-            },
-            "priority_actions": readiness_info["priority_actions"],
-            "next_steps": readiness_info["next_steps"],
-            "section_analysis": section_analysis,
-            "benchmarking": _get_benchmarking_info(total_score),
-            "recommendations": _get_readiness_recommendations(total_score, section_analysis)
-        }
-        
-        return json.dumps(result, indent=2)
+        return json_dumps(_determine_readiness_level_impl(total_score, sections_data), indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to determine readiness level: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to determine readiness level: {str(e)}"})
+
+
+def _determine_readiness_level_impl(total_score: int, sections_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Determine readiness from a total score and already-parsed section scores; shared by the tool and programmatic callers"""
+    # Validate total score
+    if not isinstance(total_score, int) or total_score < 0 or total_score > 100:
+        return {"success": False, "error": f"Total score must be between 0 and 100, got {total_score}"}
+    
+    # Determine basic readiness level
+    readiness_info = _get_readiness_level_info(total_score)
+    
+    section_analysis = None
+    if sections_data is not None:
+        try:
+            section_analysis = _analyze_section_performance(sections_data)
+        except Exception:
+            # Continue without section analysis if the section data is malformed
+            pass
+    
+    return {
+        "success": True,
+        "total_score": total_score,
+        "readiness_level": readiness_info["level"],
+        "readiness_description": readiness_info["description"],
+        "readiness_details": {
+            "category": readiness_info["category"],
+            "score_range": readiness_info["range"],
+            "timeline": readiness_info["timeline"],
+            "approach": readiness_info["approach"]
+        },
+        "priority_actions": readiness_info["priority_actions"],
+        "next_steps": readiness_info["next_steps"],
+        "section_analysis": section_analysis,
+        "benchmarking": _get_benchmarking_info(total_score),
+        "recommendations": _get_readiness_recommendations(total_score, section_analysis)
+    }
 
 
 @tool
@@ -210,79 +249,107 @@ def compare_scores(current_scores: str, benchmark_scores: str = None) -> str:
     try:
         # Parse current scores
         try:
-            current_data = json.loads(current_scores)
+            current_data = json_loads(current_scores)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for current scores"})
+            return json_dumps({"success": False, "error": "Invalid JSON format for current scores"})
         
         # Parse benchmark scores if provided
         benchmark_data = None
         if benchmark_scores:
             try:
-                benchmark_data = json.loads(benchmark_scores)
+                benchmark_data = json_loads(benchmark_scores)
             except json.JSONDecodeError:
-                return json.dumps({"success": False, "error": "Invalid JSON format for benchmark scores"})
-        
-        # Calculate current totals
-        current_total = sum(score.get("section_total", 0) for score in current_data.values())
-        current_max = sum(score.get("max_possible", 0) for score in current_data.values())
-        current_percentage = (current_total / current_max) * 100 if current_max > 0 else 0
+                return json_dumps({"success": False, "error": "Invalid JSON format for benchmark scores"})
         
-        result = {
-            "success": True,
-            "current_assessment": {
-                "total_score": current_total,
-                "max_possible": current_max,
-                "percentage": round(current_percentage, 1),
-                "readiness_level": _get_readiness_level_info(current_total)["level"]
-            },
-            "section_comparison": _compare_section_scores(current_data, benchmark_data),
-            "performance_trends": _analyze_performance_trends(current_data, benchmark_data),
-            "improvement_analysis": _analyze_improvements(current_data, benchmark_data),
-            "recommendations": _get_comparison_recommendations(current_data, benchmark_data)
-        }
+        return json_dumps(_compare_scores_impl(current_data, benchmark_data), indent=PRETTY_OUTPUT)
         
-        # Add benchmark comparison if provided
-        if benchmark_data:
-            benchmark_total = sum(score.get("section_total", 0) for score in benchmark_data.values())
-            benchmark_max = sum(score.get("max_possible", 0) for score in benchmark_data.values())
-            benchmark_percentage = (benchmark_total / benchmark_max) * 100 if benchmark_max > 0 else 0
-            
-            result["benchmark_assessment"] = {
-                "total_score": benchmark_total,
-                "max_possible": benchmark_max,
-                "percentage": round(benchmark_percentage, 1),
-                "readiness_level": _get_readiness_level_info(benchmark_total)["level"]
-            }
-            
-            result["score_changes"] = {
-                "total_change": current_total - benchmark_total,
-                "percentage_change": round(current_percentage - benchmark_percentage, 1),
-                "sections_improved": _count_improved_sections(current_data, benchmark_data),
-                "sections_declined": _count_declined_sections(current_data, benchmark_data)
-            }
+    except Exception as e:
+        return json_dumps({"success": False, "error": f"Failed to compare scores: {str(e)}"})
+
+
+def _compare_scores_impl(current_data: Dict[str, Any], benchmark_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Compare already-parsed section scores; shared by the tool and programmatic callers"""
+    # Calculate current totals
+    current_total, current_max = _score_totals(current_data)
+    current_percentage = (current_total / current_max) * 100 if current_max > 0 else 0
+    section_diff = _diff_sections(current_data, benchmark_data)
+    
+    result = {
+        "success": True,
+        "current_assessment": {
+            "total_score": current_total,
+            "max_possible": current_max,
+            "percentage": round(current_percentage, 1),
+            "readiness_level": _get_readiness_level_info(current_total)["level"]
+        },
+        "section_comparison": [comparison.to_dict() for comparison in section_diff["comparisons"]],
+        "performance_trends": _analyze_performance_trends(current_data, benchmark_data, section_diff),
+        "improvement_analysis": _analyze_improvements(benchmark_data, section_diff),
+        "recommendations": _get_comparison_recommendations(current_data, benchmark_data)
+    }
+    
+    # Add benchmark comparison if provided
+    if benchmark_data:
+        benchmark_total, benchmark_max = _score_totals(benchmark_data)
+        benchmark_percentage = (benchmark_total / benchmark_max) * 100 if benchmark_max > 0 else 0
         
-        return json.dumps(result, indent=2)
+        result["benchmark_assessment"] = {
+            "total_score": benchmark_total,
+            "max_possible": benchmark_max,
+            "percentage": round(benchmark_percentage, 1),
+            "readiness_level": _get_readiness_level_info(benchmark_total)["level"]
+        }
         
-    except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to compare scores: {str(e)}"})
+        result["score_changes"] = {
+            "total_change": current_total - benchmark_total,
+            "percentage_change": round(current_percentage - benchmark_percentage, 1),
+            "sections_improved": len(section_diff["improved_sections"]),
+            "sections_declined": section_diff["declined_count"]
+        }
+    
+    return result
+
+
+@lru_cache(maxsize=64)
+def _score_summary(scores: Tuple[int, ...]) -> Dict[str, Any]:
+    """Summarize a section's scores once for the helpers that analyze them.
+    
+    The returned dict is shared between calls with the same scores, so callers must treat it as read-only.
+    """
+    counts = Counter(scores)
+    
+    return {
+        "mean": sum(scores) / len(scores),
+        "min": min(counts),
+        "max": max(counts),
+        # Most frequent score, ties going to the lowest score
+        "mode": min(counts, key=lambda score: (-counts[score], score)),
+        # Lazy pairwise checks stop at the first out-of-order pair
+        "ascending": all(a <= b for a, b in zip(scores, scores[1:])),
+        "descending": all(a >= b for a, b in zip(scores, scores[1:]))
+    }
+
+
+# Score consistency by spread between highest and lowest score; spreads past the end are "Low"
+_CONSISTENCY_LABELS = ("High", "High", "Medium", "Low")
 
 
 def _analyze_section_scores(section_id: str, responses: Dict[str, int]) -> Dict[str, Any]:
     """Analyze section scores for patterns and insights"""
-    scores = list(responses.values())
+    summary = _score_summary(tuple(responses.values()))
+    spread = summary["max"] - summary["min"]
     
     return {
-        "average_score": round(sum(scores) / len(scores), 2),
-        "score_consistency": "High" if max(scores) - min(scores) <= 1 else "Medium" if max(scores) - min(scores) <= 2 else "Low",
-        "dominant_score": max(set(scores), key=scores.count),
-        "score_trend": "Improving" if scores == sorted(scores) else "Declining" if scores == sorted(scores, reverse=True) else "Mixed"
+        "average_score": round(summary["mean"], 2),
+        "score_consistency": _CONSISTENCY_LABELS[min(spread, len(_CONSISTENCY_LABELS) - 1)],
+        "dominant_score": summary["mode"],
+        "score_trend": "Improving" if summary["ascending"] else "Declining" if summary["descending"] else "Mixed"
     }
 
 
 def _get_score_recommendations(section_id: str, responses: Dict[str, int]) -> List[str]:
     """Get recommendations based on section scores"""
-    scores = list(responses.values())
-    avg_score = sum(scores) / len(scores)
+    avg_score = _score_summary(tuple(responses.values()))["mean"]
     
     recommendations = []
     
@@ -299,143 +366,158 @@ def _get_score_recommendations(section_id: str, responses: Dict[str, int]) -> Li
     return recommendations
 
 
-def _get_performance_level(percentage: float) -> str:
-    """Get performance level based on percentage"""
-    if percentage >= 90:
-        return "Excellent"
-    elif percentage >= 80:
-        return "Good"
-    elif percentage >= 70:
-        return "Above Average"
-    elif percentage >= 60:
-        return "Average"
-    elif percentage >= 50:
-        return "Below Average"
-    else:
-        return "Needs Improvement"
-
-
-def _get_score_distribution(scores: List[int]) -> Dict[str, int]:
-    """Get distribution of scores"""
-    distribution = {str(i): 0 for i in range(1, 6)}
-    for score in scores:
-        distribution[str(score)] += 1
-    return distribution
-
-
+# Lower bounds for each performance level, lowest first; labels line up with bisect_right positions
+_PERFORMANCE_THRESHOLDS = (50, 60, 70, 80, 90)
+_PERFORMANCE_LEVELS = ("Needs Improvement", "Below Average", "Average", "Above Average", "Good", "Excellent")
 
 
+def _get_performance_level(percentage: float) -> str:
+    """Get performance level based on percentage"""
+    return _PERFORMANCE_LEVELS[bisect_right(_PERFORMANCE_THRESHOLDS, percentage)]
 
 
+def _get_score_statistics(scores: List[int]) -> Dict[str, Any]:
+    """Get summary statistics for a list of scores from one sorted copy and one tally"""
+    ordered = sorted(scores)
+    counts = Counter(scores)
+    count = len(ordered)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    
+    return {
+        "mean": round(statistics.mean(ordered), 2),
+        "median": median,
+        "mode": counts.most_common(1)[0][0] if len(counts) < count else None,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "range": ordered[-1] - ordered[0],
+        "std_dev": round(statistics.stdev(ordered), 2) if count > 1 else 0
+    }
 
 
-def _get_readiness_level_info(total_score: int) -> Dict[str, Any]:
+def _get_score_distribution(scores: List[int]) -> Dict[str, int]:
+    """Get distribution of scores"""
+    counts = Counter(scores)
+    return {str(i): counts[i] for i in range(1, 6)}
+
+
+
+
+
+
+
+
+# Readiness level details, one entry per band of total scores; shared between calls, so read-only
+_READINESS_LEVELS = (
+    MappingProxyType({
+        "level": "🔴 Not Ready",
+        "category": "Foundation Building Required",
+        "description": "Significant foundational work needed before AI implementation",
+        "range": "0-40 points",
+        "timeline": "6-12 months of foundation building before AI pilots",
+        "approach": "Focus on basic infrastructure and capability building",
+        "priority_actions": (
+            "Invest in basic IT infrastructure and data systems",
+            "Develop data governance policies and procedures",
+            "Build technical skills through training programs",
+            "Establish clear digital transformation strategy",
+            "Ensure regulatory compliance framework"
+        ),
+        "next_steps": (
+            "Conduct infrastructure assessment",
+            "Develop skills training program",
+            "Create data governance framework"
+        )
+    }),
+    MappingProxyType({
+        "level": "🟡 Foundation Building",
+        "category": "Addressing Key Gaps",
+        "description": "Some readiness exists but key gaps need addressing",
+        "range": "41-60 points",
+        "timeline": "3-6 months of capability building, then pilot projects",
+        "approach": "Start with Level 1 AI (Basic Automation) while building capabilities",
+        "priority_actions": (
+            "Improve data quality and integration capabilities",
+            "Enhance team technical and analytical skills",
+            "Develop process documentation and automation",
+            "Strengthen cybersecurity and compliance measures",
+            "Secure leadership commitment and budget allocation"
+        ),
+        "next_steps": (
+            "Prioritize data quality improvements",
+            "Launch skills development programs",
+            "Begin process automation initiatives"
+        )
+    }),
+    MappingProxyType({
+        "level": "🟠 Ready for Pilots",
+        "category": "Pilot Implementation Ready",
+        "description": "Good foundation for starting AI implementation",
+        "range": "61-75 points",
+        "timeline": "Ready for immediate pilot projects",
+        "approach": "Begin with Level 1-2 AI implementations, plan for Level 3",
+        "priority_actions": (
+            "Select high-impact, low-risk AI pilot projects",
+            "Invest in cloud infrastructure and advanced analytics",
+            "Develop AI governance and ethics framework",
+            "Build internal AI expertise through training or hiring",
+            "Establish performance measurement for AI initiatives"
+        ),
+        "next_steps": (
+            "Identify and launch pilot AI projects",
+            "Establish AI governance framework",
+            "Build AI expertise and capabilities"
+        )
+    }),
+    MappingProxyType({
+        "level": "🟢 AI Ready",
+        "category": "Comprehensive Implementation Ready",
+        "description": "Strong readiness for comprehensive AI implementation",
+        "range": "76-85 points",
+        "timeline": "Ready for multiple AI initiatives",
+        "approach": "Implement Level 1-3 AI solutions, prepare for intelligent automation",
+        "priority_actions": (
+            "Launch multiple AI initiatives across different business areas",
+            "Invest in advanced AI platforms and tools",
+            "Develop AI center of excellence",
+            "Create partnerships with AI vendors and consultants",
+            "Plan for Level 3-4 AI implementations"
+        ),
+        "next_steps": (
+            "Scale AI implementations across business",
+            "Establish AI center of excellence",
+            "Develop advanced AI capabilities"
+        )
+    }),
+    MappingProxyType({
+        "level": "🔵 AI Advanced",
+        "category": "Cutting-edge Implementation Ready",
+        "description": "Excellent readiness for cutting-edge AI implementation",
+        "range": "86-100 points",
+        "timeline": "Ready for advanced AI implementations",
+        "approach": "Full spectrum AI implementation including Level 4-5 solutions",
+        "priority_actions": (
+            "Implement advanced AI solutions across all business functions",
+            "Develop proprietary AI capabilities and models",
+            "Lead industry AI adoption and best practices",
+            "Explore agentic AI and autonomous systems",
+            "Consider AI-powered business model innovation"
+        ),
+        "next_steps": (
+            "Lead industry AI innovation",
+            "Develop proprietary AI solutions",
+            "Explore cutting-edge AI technologies"
+        )
+    })
+)
+
+# Inclusive upper bound of each band except the last, which covers everything above 85
+_READINESS_UPPER_BOUNDS = (40, 60, 75, 85)
+
+
+def _get_readiness_level_info(total_score: int) -> Mapping[str, Any]:
     """Get comprehensive readiness level information"""
-    if total_score <= 40:
-        return {
-            "level": "🔴 Not Ready",
-            "category": "Foundation Building Required",
-            "description": "Significant foundational work needed before AI implementation",
-            "range": "0-40 points",
-            "timeline": "6-12 months of foundation building before AI pilots",
-            "approach": "Focus on basic infrastructure and capability building",
-            "priority_actions": [
-                "Invest in basic IT infrastructure and data systems",
-                "Develop data governance policies and procedures",
-                "Build technical skills through training programs",
-                "Establish clear digital transformation strategy",
-                "Ensure regulatory compliance framework"
-            ],
-            "next_steps": [
-                "Conduct infrastructure assessment",
-                "Develop skills training program",
-                "Create data governance framework"
-            ]
-        }
-    elif total_score <= 60:
-        return {
-            "level": "🟡 Foundation Building",
-            "category": "Addressing Key Gaps",
-            "description": "Some readiness exists but key gaps need addressing",
-            "range": "41-60 points",
-            "timeline": "3-6 months of capability building, then pilot projects",
-            "approach": "Start with Level 1 AI (Basic Automation) while building capabilities",
-            "priority_actions": [
-                "Improve data quality and integration capabilities",
-                "Enhance team technical and analytical skills",
-                "Develop process documentation and automation",
-                "Strengthen cybersecurity and compliance measures",
-                "Secure leadership commitment and budget allocation"
-            ],
-            "next_steps": [
-                "Prioritize data quality improvements",
-                "Launch skills development programs",
-                "Begin process automation initiatives"
-            ]
-        }
-    elif total_score <= 75:
-        return {
-            "level": "🟠 Ready for Pilots",
-            "category": "Pilot Implementation Ready",
-            "description": "Good foundation for starting AI implementation",
-            "range": "61-75 points",
-            "timeline": "Ready for immediate pilot projects",
-            "approach": "Begin with Level 1-2 AI implementations, plan for Level 3",
-            "priority_actions": [
-                "Select high-impact, low-risk AI pilot projects",
-                "Invest in cloud infrastructure and advanced analytics",
-                "Develop AI governance and ethics framework",
-                "Build internal AI expertise through training or hiring",
-                "Establish performance measurement for AI initiatives"
-            ],
-            "next_steps": [
-                "Identify and launch pilot AI projects",
-                "Establish AI governance framework",
-                "Build AI expertise and capabilities"
-            ]
-        }
-    elif total_score <= 85:
-        return {
-            "level": "🟢 AI Ready",
-            "category": "Comprehensive Implementation Ready",
-            "description": "Strong readiness for comprehensive AI implementation",
-            "range": "76-85 points",
-            "timeline": "Ready for multiple AI initiatives",
-            "approach": "Implement Level 1-3 AI solutions, prepare for intelligent automation",
-            "priority_actions": [
-                "Launch multiple AI initiatives across different business areas",
-                "Invest in advanced AI platforms and tools",
-                "Develop AI center of excellence",
-                "Create partnerships with AI vendors and consultants",
-                "Plan for Level 3-4 AI implementations"
-            ],
-            "next_steps": [
-                "Scale AI implementations across business",
-                "Establish AI center of excellence",
-                "Develop advanced AI capabilities"
-            ]
-        }
-    else:
-        return {
-            "level": "🔵 AI Advanced",
-            "category": "Cutting-edge Implementation Ready",
-            "description": "Excellent readiness for cutting-edge AI implementation",
-            "range": "86-100 points",
-            "timeline": "Ready for advanced AI implementations",
-            "approach": "Full spectrum AI implementation including Level 4-5 solutions",
-            "priority_actions": [
-                "Implement advanced AI solutions across all business functions",
-                "Develop proprietary AI capabilities and models",
-                "Lead industry AI adoption and best practices",
-                "Explore agentic AI and autonomous systems",
-                "Consider AI-powered business model innovation"
-            ],
-            "next_steps": [
-                "Lead industry AI innovation",
-                "Develop proprietary AI solutions",
-                "Explore cutting-edge AI technologies"
-            ]
-        }
+    return _READINESS_LEVELS[bisect_left(_READINESS_UPPER_BOUNDS, total_score)]
 
 
 def _analyze_section_performance(sections_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -451,20 +533,22 @@ def _analyze_section_performance(sections_data: Dict[str, Any]) -> Dict[str, Any
     if not section_percentages:
         return {}
     
-    best_section = max(section_percentages, key=section_percentages.get)
-    worst_section = min(section_percentages, key=section_percentages.get)
+    # Rank once with a C-level key; the first entry is the same section max() would pick
+    section_rankings = sorted(section_percentages.items(), key=itemgetter(1), reverse=True)
+    best_section, best_percentage = section_rankings[0]
+    worst_section, worst_percentage = min(section_percentages.items(), key=itemgetter(1))
     
     return {
         "strongest_area": {
             "section": best_section,
-            "percentage": round(section_percentages[best_section], 1)
+            "percentage": round(best_percentage, 1)
         },
         "weakest_area": {
             "section": worst_section,
-            "percentage": round(section_percentages[worst_section], 1)
+            "percentage": round(worst_percentage, 1)
         },
-        "performance_balance": "Balanced" if max(section_percentages.values()) - min(section_percentages.values()) <= 20 else "Unbalanced",
-        "section_rankings": sorted(section_percentages.items(), key=lambda x: x[1], reverse=True)
+        "performance_balance": "Balanced" if best_percentage - worst_percentage <= 20 else "Unbalanced",
+        "section_rankings": section_rankings
     }
 
 
@@ -477,18 +561,14 @@ def _get_benchmarking_info(total_score: int) -> Dict[str, Any]:
     }
 
 
+# Lower bounds for each percentile band, lowest first; labels line up with bisect_right positions
+_PERCENTILE_THRESHOLDS = (45, 60, 75, 85)
+_PERCENTILE_BANDS = ("Bottom 25%", "Bottom 50%", "Top 50%", "Top 25%", "Top 10%")
+
+
 def _estimate_percentile(total_score: int) -> str:
     """Estimate percentile based on score"""
-    if total_score >= 85:
-        return "Top 10%"
-    elif total_score >= 75:
-        return "Top 25%"
-    elif total_score >= 60:
-        return "Top 50%"
-    elif total_score >= 45:
-        return "Bottom 50%"
-    else:
-        return "Bottom 25%"
+    return _PERCENTILE_BANDS[bisect_right(_PERCENTILE_THRESHOLDS, total_score)]
 
 
 def _get_readiness_recommendations(total_score: int, section_analysis: Dict[str, Any]) -> List[str]:
@@ -508,71 +588,79 @@ def _get_readiness_recommendations(total_score: int, section_analysis: Dict[str,
     return recommendations
 
 
-def _compare_section_scores(current_data: Dict, benchmark_data: Dict) -> List[Dict]:
-    """Compare section scores between current and benchmark"""
+def _score_totals(sections_data: Dict) -> Tuple[int, int]:
+    """Sum section totals and maximum possible scores in one pass"""
+    total = 0
+    max_possible = 0
+    for score in sections_data.values():
+        total += score.get("section_total", 0)
+        max_possible += score.get("max_possible", 0)
+    return total, max_possible
+
+
+def _diff_sections(current_data: Dict, benchmark_data: Dict) -> Dict[str, Any]:
+    """Compare each current section with its benchmark in a single pass"""
     comparisons = []
+    improved_sections = []
+    declined_count = 0
     
-    for section_id in current_data.keys():
-        current = current_data[section_id]
-        benchmark = benchmark_data.get(section_id) if benchmark_data else None
+    for section_id, current in current_data.items():
+        current_total = current.get("section_total", 0)
+        current_percentage = (current_total / current.get("max_possible", 1)) * 100
+        comparison = SectionComparison(section_id, current_total, round(current_percentage, 1))
         
-        comparison = {
-            "section_id": section_id,
-            "current_score": current.get("section_total", 0),
-            "current_percentage": round((current.get("section_total", 0) / current.get("max_possible", 1)) * 100, 1)
-        }
-        
-        if benchmark:
-            comparison["benchmark_score"] = benchmark.get("section_total", 0)
-            comparison["benchmark_percentage"] = round((benchmark.get("section_total", 0) / benchmark.get("max_possible", 1)) * 100, 1)
-            comparison["change"] = current.get("section_total", 0) - benchmark.get("section_total", 0)
-            comparison["percentage_change"] = comparison["current_percentage"] - comparison["benchmark_percentage"]
+        if benchmark_data and section_id in benchmark_data:
+            benchmark = benchmark_data[section_id]
+            benchmark_total = benchmark.get("section_total", 0)
+            
+            if current_total > benchmark_total:
+                improved_sections.append(section_id)
+            elif current_total < benchmark_total:
+                declined_count += 1
+            
+            if benchmark:
+                benchmark_percentage = (benchmark_total / benchmark.get("max_possible", 1)) * 100
+                comparison.benchmark_score = benchmark_total
+                comparison.benchmark_percentage = round(benchmark_percentage, 1)
+                comparison.change = current_total - benchmark_total
+                # Round the unrounded difference once, rather than subtracting already-rounded values
+                comparison.percentage_change = round(current_percentage - benchmark_percentage, 1)
         
         comparisons.append(comparison)
     
-    return comparisons
+    return {
+        "comparisons": comparisons,
+        "improved_sections": improved_sections,
+        "declined_count": declined_count
+    }
+
 
+# Overall trend indexed by the sign of improvements minus declines, shifted to 0..2
+_TREND_LABELS = ("Declining", "Stable", "Improving")
 
-def _analyze_performance_trends(current_data: Dict, benchmark_data: Dict) -> Dict[str, Any]:
+
+def _analyze_performance_trends(current_data: Dict, benchmark_data: Dict, section_diff: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze performance trends"""
     if not benchmark_data:
         return {"trend": "No benchmark data available"}
     
-    improvements = 0
-    declines = 0
-    
-    for section_id in current_data.keys():
-        if section_id in benchmark_data:
-            current_score = current_data[section_id].get("section_total", 0)
-            benchmark_score = benchmark_data[section_id].get("section_total", 0)
-            
-            if current_score > benchmark_score:
-                improvements += 1
-            elif current_score < benchmark_score:
-                declines += 1
+    improvements = len(section_diff["improved_sections"])
+    declines = section_diff["declined_count"]
     
     return {
-        "overall_trend": "Improving" if improvements > declines else "Declining" if declines > improvements else "Stable",
+        "overall_trend": _TREND_LABELS[(improvements > declines) - (improvements < declines) + 1],
         "sections_improved": improvements,
         "sections_declined": declines,
         "sections_stable": len(current_data) - improvements - declines
     }
 
 
-def _analyze_improvements(current_data: Dict, benchmark_data: Dict) -> List[str]:
+def _analyze_improvements(benchmark_data: Dict, section_diff: Dict[str, Any]) -> List[str]:
     """Analyze specific improvements"""
     if not benchmark_data:
         return ["No benchmark data available for improvement analysis"]
     
-    improvements = []
-    
-    for section_id in current_data.keys():
-        if section_id in benchmark_data:
-            current_score = current_data[section_id].get("section_total", 0)
-            benchmark_score = benchmark_data[section_id].get("section_total", 0)
-            
-            if current_score > benchmark_score:
-                improvements.append(f"Improved performance in {section_id}")
+    improvements = [f"Improved performance in {section_id}" for section_id in section_diff["improved_sections"]]
     
     return improvements if improvements else ["No significant improvements identified"]
 
@@ -592,34 +680,6 @@ def _get_comparison_recommendations(current_data: Dict, benchmark_data: Dict) ->
     return recommendations
 
 
-def _count_improved_sections(current_data: Dict, benchmark_data: Dict) -> int:
-    """Count sections that improved"""
-    if not benchmark_data:
-        return 0
-    
-    count = 0
-    for section_id in current_data.keys():
-        if section_id in benchmark_data:
-            if current_data[section_id].get("section_total", 0) > benchmark_data[section_id].get("section_total", 0):
-                count += 1
-    
-    return count
-
-
-def _count_declined_sections(current_data: Dict, benchmark_data: Dict) -> int:
-    """Count sections that declined"""
-    if not benchmark_data:
-        return 0
-    
-    count = 0
-    for section_id in current_data.keys():
-        if section_id in benchmark_data:
-            if current_data[section_id].get("section_total", 0) < benchmark_data[section_id].get("section_total", 0):
-                count += 1
-    
-    return count
-
-
 # Scoring Agent Sub-agent Configuration
 SCORING_AGENT_SUBAGENT = {
     "name": "scoring-agent",
@@ -671,7 +731,8 @@ def _validate_responses(response_data: Dict[str, int]) -> Dict[str, Any]:
     if not response_data:
         return {"valid": False, "errors": ["No responses provided"]}
     
-    # Validate each response
+    # Validate each response, counting valid ones in the same pass
+    valid_responses = 0
     for question_id, score in response_data.items():
         # Check if score is an integer
         if not isinstance(score, int):
@@ -679,20 +740,22 @@ def _validate_responses(response_data: Dict[str, int]) -> Dict[str, Any]:
             continue
         
         # Check if score is in valid range (1-5)
-        if score < 1 or score > 5:
+        if score in VALID_SCORES:
+            valid_responses += 1
+        else:
             errors.append(f"Question {question_id}: Score must be between 1 and 5")
     
     return {
         "valid": len(errors) == 0,
         "errors": errors,
         "total_questions": len(response_data),
-        "valid_responses": len([s for s in response_data.values() if isinstance(s, int) and 1 <= s <= 5])
+        "valid_responses": valid_responses
     }
 
 
 def _generate_section_insights(section_id: str, response_data: Dict[str, int], percentage: float) -> str:
     """Generate insights for a section based on responses and percentage"""
-    avg_score = sum(response_data.values()) / len(response_data)
+    avg_score = _score_summary(tuple(response_data.values()))["mean"]
     
     if percentage >= 80:
         return f"Excellent performance in {section_id}. Strong foundation for AI implementation with average score of {avg_score:.1f}."
@@ -732,15 +795,11 @@ def _identify_improvement_areas(response_data: Dict[str, int]) -> List[str]:
     return improvements
 
 
+# Lower bounds for each letter grade, lowest first; labels line up with bisect_right positions
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADE_LABELS = ("F (Poor)", "D (Needs Improvement)", "C (Satisfactory)", "B (Good)", "A (Excellent)")
+
+
 def _get_grade_from_percentage(percentage: float) -> str:
     """Convert percentage to letter grade"""
-    if percentage >= 90:
-        return "A (Excellent)"
-    elif percentage >= 80:
-        return "B (Good)"
-    elif percentage >= 70:
-        return "C (Satisfactory)"
-    elif percentage >= 60:
-        return "D (Needs Improvement)"
-    else:
-        return "F (Poor)"
\ No newline at end of file
+    return _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, percentage)]
\ No newline at end of file
@@ -4,6 +4,7 @@ Unit tests for data models and validation functions
 
 import unittest
 import json
+from bisect import bisect_right
 from datetime import datetime
 from ai_readiness_assessment.models import (
     AssessmentState, SectionScore, Recommendation,
@@ -11,6 +12,14 @@ from ai_readiness_assessment.models import (
 )
 
 
+# Fixed creation time for fixture data, so payloads are identical across tests and runs
+FIXTURE_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0).isoformat()
+
+# Percentage lower bounds for the readiness labels used in the flow tests, lowest first
+READINESS_THRESHOLDS = (30, 50, 70, 80)
+READINESS_LABELS = ("Not Ready", "Foundation Building", "Ready for Pilots", "AI Ready", "AI Advanced")
+
+
 class TestAssessmentState(unittest.TestCase):
     """Test AssessmentState data model"""
     
@@ -21,7 +30,7 @@ class TestAssessmentState(unittest.TestCase):
             "user_id": "user_123",
             "business_name": "Test Company",
             "industry": "Manufacturing",
-            "created_at": datetime.now().isoformat(),
+            "created_at": FIXTURE_TIMESTAMP,
             "sections": {
                 "data_infrastructure": {
                     "responses": {"q1": 4, "q2": 3, "q3": 5},
@@ -220,7 +229,7 @@ class TestDataModelIntegration(unittest.TestCase):
             "user_id": "user_123",
             "business_name": "Test Company",
             "industry": "Manufacturing",
-            "created_at": datetime.now().isoformat(),
+            "created_at": FIXTURE_TIMESTAMP,
             "sections": {
                 "data_infrastructure": {
                     "responses": {"q1": 4, "q2": 3, "q3": 5, "q4": 2, "q5": 4},
@@ -273,23 +282,16 @@ class TestDataModelIntegration(unittest.TestCase):
             )
         }
         
-        # Calculate total score
-        total_score = sum(score.section_total for score in section_scores.values())
-        max_total = sum(score.max_possible for score in section_scores.values())
+        # Calculate total and maximum score in one pass over the sections
+        total_score = max_total = 0
+        for score in section_scores.values():
+            total_score += score.section_total
+            max_total += score.max_possible
         
         # Determine readiness level based on total score
         percentage = (total_score / max_total) * 100
         
-        if percentage >= 80:
-            readiness_level = "AI Advanced"
-        elif percentage >= 70:
-            readiness_level = "AI Ready"
-        elif percentage >= 50:
-            readiness_level = "Ready for Pilots"
-        elif percentage >= 30:
-            readiness_level = "Foundation Building"
-        else:
-            readiness_level = "Not Ready"
+        readiness_level = READINESS_LABELS[bisect_right(READINESS_THRESHOLDS, percentage)]
         
         # Create recommendation
         recommendation = Recommendation(
@@ -4,14 +4,40 @@ Performance tests for concurrent assessment handling and system load
 
 import unittest
 import json
+import statistics
+import sys
 import time
-import threading
-import queue
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from ai_readiness_assessment.main_agent import orchestrate_assessment_flow, health_check
 from ai_readiness_assessment.subagents.scoring_agent import calculate_section_score
 from ai_readiness_assessment.subagents.recommendation_agent import generate_personalized_recommendations
-from ai_readiness_assessment.persistence import save_assessment_state, load_assessment_state
+from ai_readiness_assessment.persistence import AssessmentPersistence, save_assessment_state, load_assessment_state
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+# Worker pool shared by the concurrency tests, so threads are started once per module run
+# rather than per test; sized to cover the largest concurrent load below
+_pool = None
+
+
+def setUpModule():
+    global _pool
+    _pool = ThreadPoolExecutor(max_workers=32)
+
+
+def tearDownModule():
+    _pool.shutdown(wait=True)
+
+
+def _peak_memory_mb():
+    """Peak resident memory of this process in MB, from a single getrusage call"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KB on Linux
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
 
 
 class TestPerformanceBasics(unittest.TestCase):
@@ -25,6 +51,10 @@ class TestPerformanceBasics(unittest.TestCase):
             "industry": "Technology",
             "size": "Medium"
         }
+        # Serialize request payloads up front so the timings cover the tools, not json.dumps
+        self.responses_json = json.dumps(self.test_responses)
+        self.business_info_json = json.dumps(self.test_business_info)
+        self.start_payload = json.dumps({"business_info": self.test_business_info})
         self.performance_thresholds = {
             "health_check": 2.0,  # seconds
             "section_score": 3.0,
@@ -34,12 +64,12 @@ class TestPerformanceBasics(unittest.TestCase):
     
     def test_health_check_performance(self):
         """Test health check response time"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         result = health_check.invoke({})
         
-        end_time = time.time()
-        response_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        response_time = (end_time - start_time) / 1e9
         
         self.assertLess(response_time, self.performance_thresholds["health_check"],
             f"Health check took {response_time:.2f}s, should be under {self.performance_thresholds['health_check']}s")
@@ -48,15 +78,15 @@ class TestPerformanceBasics(unittest.TestCase):
     
     def test_section_score_performance(self):
         """Test section score calculation performance"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         result = calculate_section_score.invoke({
             "section_id": "data_infrastructure",
-            "responses": json.dumps(self.test_responses)
+            "responses": self.responses_json
         })
         
-        end_time = time.time()
-        response_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        response_time = (end_time - start_time) / 1e9
         
         self.assertLess(response_time, self.performance_thresholds["section_score"],
             f"Section score calculation took {response_time:.2f}s, should be under {self.performance_thresholds['section_score']}s")
@@ -65,15 +95,15 @@ class TestPerformanceBasics(unittest.TestCase):
     
     def test_start_assessment_performance(self):
         """Test assessment start performance"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         result = orchestrate_assessment_flow.invoke({
             "action": "start_assessment",
-            "data": json.dumps({"business_info": self.test_business_info})
+            "data": self.start_payload
         })
         
-        end_time = time.time()
-        response_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        response_time = (end_time - start_time) / 1e9
         
         self.assertLess(response_time, self.performance_thresholds["start_assessment"],
             f"Start assessment took {response_time:.2f}s, should be under {self.performance_thresholds['start_assessment']}s")
@@ -89,16 +119,17 @@ class TestPerformanceBasics(unittest.TestCase):
                 "data_infrastructure": {"section_total": 18, "max_possible": 25}
             }
         }
+        assessment_results_json = json.dumps(test_assessment_results)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         result = generate_personalized_recommendations.invoke({
-            "assessment_results": json.dumps(test_assessment_results),
-            "business_info": json.dumps(self.test_business_info)
+            "assessment_results": assessment_results_json,
+            "business_info": self.business_info_json
         })
         
-        end_time = time.time()
-        response_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        response_time = (end_time - start_time) / 1e9
         
         self.assertLess(response_time, self.performance_thresholds["generate_recommendations"],
             f"Recommendation generation took {response_time:.2f}s, should be under {self.performance_thresholds['generate_recommendations']}s")
@@ -114,45 +145,55 @@ class TestConcurrentOperations(unittest.TestCase):
         self.test_responses = {"q1": 4, "q2": 3, "q3": 5, "q4": 2, "q5": 4}
         self.concurrent_users = 5
         self.operations_per_user = 3
+        
+        # Payloads that are the same for every simulated user, serialized once
+        self.responses_json = json.dumps(self.test_responses)
+        self.submit_payload = json.dumps({
+            "section": "data_infrastructure",
+            "responses": self.test_responses
+        })
+        self.scores_payload = json.dumps({
+            "assessment_data": {
+                "sections": {
+                    "data_infrastructure": {
+                        "responses": self.test_responses,
+                        "completed": True
+                    }
+                }
+            }
+        })
     
     def test_concurrent_health_checks(self):
         """Test concurrent health check operations"""
-        results_queue = queue.Queue()
-        
         def run_health_check(user_id):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 result = health_check.invoke({})
-                end_time = time.time()
+                end_time = time.perf_counter_ns()
                 
-                results_queue.put({
+                return {
                     "user_id": user_id,
                     "success": True,
-                    "response_time": end_time - start_time,
-                    "result_length": len(result)
-                })
+                    "response_time": (end_time - start_time) / 1e9,
+                    "ok": bool(result)
+                }
             except Exception as e:
-                results_queue.put({
+                return {
                     "user_id": user_id,
                     "success": False,
                     "error": str(e)
-                })
+                }
         
-        # Start concurrent operations
-        threads = []
-        for user_id in range(self.concurrent_users):
-            thread = threading.Thread(target=run_health_check, args=(user_id,))
-            threads.append(thread)
-            thread.start()
+        # Run concurrent operations on the shared pool and wait for completion
+        futures = {_pool.submit(run_health_check, user_id): user_id for user_id in range(self.concurrent_users)}
+        done, not_done = wait(futures, timeout=10)
         
-        # Wait for completion
-        for thread in threads:
-            thread.join(timeout=10)
-        
-        # Analyze results
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
+        # Checks still running at the deadline count as failed operations
+        results = [future.result() for future in done]
+        results.extend(
+            {"user_id": futures[future], "success": False, "error": "timeout"}
+            for future in not_done
+        )
         
         # All operations should complete
         self.assertEqual(len(results), self.concurrent_users)
@@ -164,50 +205,35 @@ class TestConcurrentOperations(unittest.TestCase):
         
         # Response times should be reasonable
         if successful_operations:
-            avg_response_time = sum(r["response_time"] for r in successful_operations) / len(successful_operations)
+            avg_response_time = statistics.fmean(r["response_time"] for r in successful_operations)
             self.assertLess(avg_response_time, 5.0, "Average response time should be under 5 seconds")
     
     def test_concurrent_section_scoring(self):
         """Test concurrent section scoring operations"""
-        results_queue = queue.Queue()
-        
         def run_section_scoring(user_id):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 result = calculate_section_score.invoke({
                     "section_id": f"data_infrastructure_{user_id}",
-                    "responses": json.dumps(self.test_responses)
+                    "responses": self.responses_json
                 })
-                end_time = time.time()
+                end_time = time.perf_counter_ns()
                 
-                results_queue.put({
+                return {
                     "user_id": user_id,
                     "success": True,
-                    "response_time": end_time - start_time,
-                    "result": result
-                })
+                    "response_time": (end_time - start_time) / 1e9,
+                    "ok": bool(result)
+                }
             except Exception as e:
-                results_queue.put({
+                return {
                     "user_id": user_id,
                     "success": False,
                     "error": str(e)
-                })
+                }
         
-        # Start concurrent operations
-        threads = []
-        for user_id in range(self.concurrent_users):
-            thread = threading.Thread(target=run_section_scoring, args=(user_id,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join(timeout=15)
-        
-        # Analyze results
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
+        # Run concurrent operations on the shared pool and wait for completion
+        results = list(_pool.map(run_section_scoring, range(self.concurrent_users), timeout=15))
         
         # Check success rate
         successful_operations = [r for r in results if r["success"]]
@@ -216,27 +242,25 @@ class TestConcurrentOperations(unittest.TestCase):
     
     def test_concurrent_assessment_workflows(self):
         """Test concurrent complete assessment workflows"""
-        with ThreadPoolExecutor(max_workers=self.concurrent_users) as executor:
-            futures = []
-            
-            for user_id in range(self.concurrent_users):
-                future = executor.submit(self._run_assessment_workflow, user_id)
-                futures.append(future)
-            
-            # Collect results
-            results = []
-            for future in as_completed(futures, timeout=30):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({"success": False, "error": str(e)})
-            
-            # Analyze results
-            successful_workflows = [r for r in results if r["success"]]
-            success_rate = len(successful_workflows) / len(results) if results else 0
-            
-            self.assertGreaterEqual(success_rate, 0.6, "At least 60% of concurrent workflows should succeed")
+        futures = [
+            _pool.submit(self._run_assessment_workflow, user_id)
+            for user_id in range(self.concurrent_users)
+        ]
+        
+        # Collect results
+        results = []
+        for future in as_completed(futures, timeout=30):
+            try:
+                result = future.result()
+                results.append(result)
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+        
+        # Analyze results
+        successful_workflows = [r for r in results if r["success"]]
+        success_rate = len(successful_workflows) / len(results) if results else 0
+        
+        self.assertGreaterEqual(success_rate, 0.6, "At least 60% of concurrent workflows should succeed")
     
     def _run_assessment_workflow(self, user_id):
         """Run a complete assessment workflow for performance testing"""
@@ -256,26 +280,14 @@ class TestConcurrentOperations(unittest.TestCase):
             # Step 2: Submit responses
             submit_result = orchestrate_assessment_flow.invoke({
                 "action": "submit_responses",
-                "data": json.dumps({
-                    "section": "data_infrastructure",
-                    "responses": self.test_responses
-                }),
+                "data": self.submit_payload,
                 "assessment_id": f"test_assessment_{user_id}"
             })
             
             # Step 3: Calculate scores
             scores_result = orchestrate_assessment_flow.invoke({
                 "action": "calculate_scores",
-                "data": json.dumps({
-                    "assessment_data": {
-                        "sections": {
-                            "data_infrastructure": {
-                                "responses": self.test_responses,
-                                "completed": True
-                            }
-                        }
-                    }
-                })
+                "data": self.scores_payload
             })
             
             return {"success": True, "user_id": user_id}
@@ -287,37 +299,53 @@ class TestConcurrentOperations(unittest.TestCase):
 class TestMemoryUsage(unittest.TestCase):
     """Test memory usage patterns"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Warm up the persistence path once, so large data timings exclude first-call setup"""
+        save_assessment_state.invoke({
+            "assessment_id": "_warmup",
+            "assessment_data": '{"user_id": "_warmup"}',
+            "auto_save": False
+        })
+        load_assessment_state.invoke({
+            "assessment_id": "_warmup",
+            "include_history": False
+        })
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the warm-up assessment and its history file"""
+        persistence = AssessmentPersistence()
+        persistence.get_assessment_path("_warmup").unlink(missing_ok=True)
+        persistence.get_history_path("_warmup").unlink(missing_ok=True)
+    
     def setUp(self):
         """Set up memory test data"""
         self.large_responses = {f"q{i}": (i % 5) + 1 for i in range(1, 101)}  # 100 questions
         self.test_iterations = 50
     
+    @unittest.skipIf(resource is None, "resource module not available on this platform")
     def test_memory_stability_repeated_operations(self):
         """Test memory stability with repeated operations"""
-        import psutil
-        import os
-        
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        initial_memory = _peak_memory_mb()
         
         # Perform repeated operations
         for i in range(self.test_iterations):
             try:
                 result = health_check.invoke({})
                 
-                # Occasionally check memory usage
-                if i % 10 == 0:
-                    current_memory = process.memory_info().rss / 1024 / 1024  # MB
-                    memory_increase = current_memory - initial_memory
-                    
-                    # Memory increase should be reasonable (less than 100MB)
-                    self.assertLess(memory_increase, 100,
-                        f"Memory usage increased by {memory_increase:.1f}MB after {i} operations")
+                # Sampling is a single syscall, so check memory usage after every operation
+                current_memory = _peak_memory_mb()
+                memory_increase = current_memory - initial_memory
+                
+                # Memory increase should be reasonable (less than 100MB)
+                self.assertLess(memory_increase, 100,
+                    f"Memory usage increased by {memory_increase:.1f}MB after {i} operations")
                 
             except Exception:
                 pass  # Continue testing even if some operations fail
         
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
+        final_memory = _peak_memory_mb()
         total_memory_increase = final_memory - initial_memory
         
         # Total memory increase should be reasonable
@@ -340,31 +368,32 @@ class TestMemoryUsage(unittest.TestCase):
                 "responses": self.large_responses,
                 "completed": True
             }
+        large_assessment_json = json.dumps(large_assessment_data)
         
         try:
             # Test saving large data
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             
             save_result = save_assessment_state.invoke({
                 "assessment_id": "large_test",
-                "assessment_data": json.dumps(large_assessment_data),
+                "assessment_data": large_assessment_json,
                 "auto_save": False
             })
             
-            save_time = time.time() - start_time
+            save_time = (time.perf_counter_ns() - start_time) / 1e9
             
             # Should complete within reasonable time
-            self.assertLess(save_time, 10.0, "Large data save should complete within 10 seconds")
+            self.assertLess(save_time, 2.0, "Large data save should complete within 2 seconds")
             
             # Test loading large data
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             
             load_result = load_assessment_state.invoke({
                 "assessment_id": "large_test",
                 "include_history": False
             })
             
-            load_time = time.time() - start_time
+            load_time = (time.perf_counter_ns() - start_time) / 1e9
             
             # Should complete within reasonable time
             self.assertLess(load_time, 5.0, "Large data load should complete within 5 seconds")
@@ -383,20 +412,19 @@ class TestScalabilityLimits(unittest.TestCase):
         def simple_operation(user_id):
             try:
                 result = health_check.invoke({})
-                return {"user_id": user_id, "success": True, "result_length": len(result)}
+                return {"user_id": user_id, "success": True, "ok": bool(result)}
             except Exception as e:
                 return {"user_id": user_id, "success": False, "error": str(e)}
         
-        with ThreadPoolExecutor(max_workers=max_users) as executor:
-            futures = [executor.submit(simple_operation, i) for i in range(max_users)]
-            
-            results = []
-            for future in as_completed(futures, timeout=30):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({"success": False, "error": str(e)})
+        futures = [_pool.submit(simple_operation, i) for i in range(max_users)]
+        
+        results = []
+        for future in as_completed(futures, timeout=30):
+            try:
+                result = future.result()
+                results.append(result)
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
         
         # Analyze results
         successful_operations = [r for r in results if r.get("success")]
@@ -411,19 +439,24 @@ class TestScalabilityLimits(unittest.TestCase):
             "At least 80% of operations should complete")
     
     def test_rapid_sequential_operations(self):
-        """Test rapid sequential operations"""
+        """Test rapid sequential operations
+        
+        Back-to-back health checks are mostly answered from the one-second result
+        cache, so this covers the cached path; test_uncached_sequential_health_checks
+        times full checks.
+        """
         operations_count = 100
         max_time_per_operation = 2.0  # seconds
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         successful_operations = 0
         
         for i in range(operations_count):
-            operation_start = time.time()
+            operation_start = time.perf_counter_ns()
             
             try:
                 result = health_check.invoke({})
-                operation_time = time.time() - operation_start
+                operation_time = (time.perf_counter_ns() - operation_start) / 1e9
                 
                 # Each operation should complete within time limit
                 if operation_time <= max_time_per_operation:
@@ -432,7 +465,7 @@ class TestScalabilityLimits(unittest.TestCase):
             except Exception:
                 pass  # Continue with next operation
         
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Should complete reasonable number of operations
         success_rate = successful_operations / operations_count
@@ -443,6 +476,22 @@ class TestScalabilityLimits(unittest.TestCase):
         avg_time_per_operation = total_time / operations_count
         self.assertLess(avg_time_per_operation, 1.0,
             f"Average time per operation ({avg_time_per_operation:.2f}s) should be under 1s")
+    
+    def test_uncached_sequential_health_checks(self):
+        """Test sequential health checks that bypass the result cache"""
+        operations_count = 5
+        operation_times = []
+        
+        for i in range(operations_count):
+            operation_start = time.perf_counter_ns()
+            result = health_check.invoke({"force": True})
+            operation_times.append((time.perf_counter_ns() - operation_start) / 1e9)
+            self.assertIsInstance(result, str)
+        
+        # Full checks should be as fast as the rapid operations above expect
+        avg_time_per_operation = statistics.fmean(operation_times)
+        self.assertLess(avg_time_per_operation, 1.0,
+            f"Average uncached health check time ({avg_time_per_operation:.2f}s) should be under 1s")
 
 
 class TestResourceUtilization(unittest.TestCase):
@@ -450,56 +499,55 @@ class TestResourceUtilization(unittest.TestCase):
     
     def test_cpu_usage_patterns(self):
         """Test CPU usage during operations"""
-        import psutil
-        
-        # Measure CPU usage during intensive operations
-        cpu_percentages = []
+        # Measure the CPU time this process spends on each operation
+        cpu_times = []
+        responses_json = json.dumps({"q1": 4, "q2": 3, "q3": 5, "q4": 2, "q5": 4})
         
         for i in range(10):
-            cpu_before = psutil.cpu_percent(interval=0.1)
+            cpu_start = time.process_time_ns()
             
             # Perform operation
             try:
                 result = calculate_section_score.invoke({
                     "section_id": "data_infrastructure",
-                    "responses": json.dumps({"q1": 4, "q2": 3, "q3": 5, "q4": 2, "q5": 4})
+                    "responses": responses_json
                 })
             except Exception:
                 pass
             
-            cpu_after = psutil.cpu_percent(interval=0.1)
-            cpu_percentages.append(max(cpu_before, cpu_after))
+            cpu_times.append((time.process_time_ns() - cpu_start) / 1e9)
         
-        # CPU usage should be reasonable
-        avg_cpu = sum(cpu_percentages) / len(cpu_percentages)
-        max_cpu = max(cpu_percentages)
+        # CPU cost per operation should be reasonable
+        avg_cpu_time = statistics.fmean(cpu_times)
+        max_cpu_time = max(cpu_times)
         
-        self.assertLess(avg_cpu, 80.0, f"Average CPU usage ({avg_cpu:.1f}%) should be under 80%")
-        self.assertLess(max_cpu, 95.0, f"Maximum CPU usage ({max_cpu:.1f}%) should be under 95%")
+        self.assertLess(avg_cpu_time, 1.0, f"Average CPU time per operation ({avg_cpu_time:.3f}s) should be under 1s")
+        self.assertLess(max_cpu_time, 2.0, f"Maximum CPU time per operation ({max_cpu_time:.3f}s) should be under 2s")
     
     def test_response_time_consistency(self):
         """Test response time consistency across multiple operations"""
         response_times = []
         
         for i in range(20):
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             
             try:
                 result = health_check.invoke({})
-                end_time = time.time()
-                response_times.append(end_time - start_time)
+                end_time = time.perf_counter_ns()
+                response_times.append((end_time - start_time) / 1e9)
             except Exception:
                 pass
         
-        if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
-            max_response_time = max(response_times)
-            min_response_time = min(response_times)
+        if len(response_times) > 1:
+            avg_response_time = statistics.fmean(response_times)
+            cut_points = statistics.quantiles(response_times, n=100, method="inclusive")
+            p50, p95, p99 = cut_points[49], cut_points[94], cut_points[98]
+            distribution = (f"p50 {p50:.3f}s, p95 {p95:.3f}s, p99 {p99:.3f}s, "
+                            f"max {max(response_times):.3f}s over {len(response_times)} calls")
             
-            # Response times should be consistent
-            time_variance = max_response_time - min_response_time
-            self.assertLess(time_variance, 3.0,
-                f"Response time variance ({time_variance:.2f}s) should be under 3s")
+            # Response times should be consistent, judged on the latency tail
+            self.assertLess(p95, 1.5, f"95th percentile response time should be under 1.5s ({distribution})")
+            self.assertLess(p99, 2.5, f"99th percentile response time should be under 2.5s ({distribution})")
             
             # Average response time should be reasonable
             self.assertLess(avg_response_time, 2.0,
@@ -4,113 +4,226 @@ Orchestrates all test categories and provides reporting
 """
 
 import unittest
-import sys
+import os
 import time
-import json
+import importlib
+import traceback
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from io import StringIO
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Any
 
-# Import all test modules
-from . import test_models
-from . import test_integration
-from . import test_scenarios
-from . import test_performance
+from ai_readiness_assessment.json_utils import json_dumps
 
+# Test suite modules, imported only when their suite is run
+SUITE_MODULES = {
+    "models": f"{__package__}.test_models",
+    "integration": f"{__package__}.test_integration",
+    "scenarios": f"{__package__}.test_scenarios",
+    "performance": f"{__package__}.test_performance"
+}
 
-class TestResult:
+# Suites with timing assertions; they run on their own after the others so CPU
+# contention from parallel suites does not skew their measurements
+SERIAL_SUITES = ("performance",)
+
+# Suite status by success rate: FAIL below 70%, WARN from 70%, PASS from 90%
+_SUITE_STATUS_THRESHOLDS = (70, 90)
+_SUITE_STATUSES = ("FAIL", "WARN", "PASS")
+_SUITE_ICONS = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌", "ERROR": "❌"}
+
+# Overall system status by success rate, from CRITICAL below 50% to EXCELLENT from 95%
+_SYSTEM_STATUS_THRESHOLDS = (50, 70, 85, 95)
+_SYSTEM_STATUSES = ("CRITICAL", "NEEDS_IMPROVEMENT", "ACCEPTABLE", "GOOD", "EXCELLENT")
+_STATUS_ICONS = {
+    "EXCELLENT": "🟢",
+    "GOOD": "🟡",
+    "ACCEPTABLE": "🟠",
+    "NEEDS_IMPROVEMENT": "🔴",
+    "CRITICAL": "💀"
+}
+
+
+def _suite_status(success_rate: float) -> str:
+    """PASS, WARN or FAIL for a suite's success rate"""
+    return _SUITE_STATUSES[bisect_right(_SUITE_STATUS_THRESHOLDS, success_rate)]
+
+
+def _format_exception(err) -> str:
+    """Format an exc_info tuple as a "Type: message" string.
+    
+    Storing the text instead of the exception releases the failing test's frames
+    and keeps results picklable for the suite worker processes.
+    """
+    return "".join(traceback.format_exception_only(err[0], err[1])).rstrip()
+
+
+# Failure and error details kept per suite; the counts stay exact past this cap
+MAX_FAILURE_RECORDS = 50
+
+# Failure and error details shown per suite in the printed summary
+_SUMMARY_DETAIL_LIMIT = 3
+
+
+class TestResult(unittest.TestResult):
     """Custom test result class for detailed reporting"""
     
-    def __init__(self):
-        self.start_time = None
-        self.end_time = None
+    def __init__(self, record_success_names: bool = False, max_failure_records: int = MAX_FAILURE_RECORDS):
+        super().__init__()
         self.tests_run = 0
-        self.failures = []
-        self.errors = []
+        self.max_failure_records = max_failure_records
+        self.failures = deque(maxlen=max_failure_records)
+        self.errors = deque(maxlen=max_failure_records)
+        self.failure_count = 0
+        self.error_count = 0
         self.skipped = []
-        self.successes = []
+        self.successes = 0
+        # Passing tests are counted; their names are kept only on request, since
+        # each test's status is already in test_details
+        self.success_names = [] if record_success_names else None
         self.test_details = {}
+        self._current_test = None
+        self._current_test_name = None
+        self._current_start_ns = 0
+    
+    def _test_name(self, test) -> str:
+        """Full name of a test, reusing the one built in startTest for the running test"""
+        if test is self._current_test:
+            return self._current_test_name
+        return test.id()
     
-    def start_test(self, test):
+    def startTest(self, test):
         """Called when a test starts"""
-        self.start_time = time.time()
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
-        self.test_details[test_name] = {"start_time": self.start_time}
+        super().startTest(test)
+        self._current_test = test
+        self._current_test_name = test.id()
+        self.test_details[self._current_test_name] = {}
+        self._current_start_ns = time.perf_counter_ns()
     
-    def stop_test(self, test):
+    def stopTest(self, test):
         """Called when a test ends"""
-        self.end_time = time.time()
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
-        if test_name in self.test_details:
-            self.test_details[test_name]["end_time"] = self.end_time
-            self.test_details[test_name]["duration"] = self.end_time - self.test_details[test_name]["start_time"]
+        end_ns = time.perf_counter_ns()
+        super().stopTest(test)
+        if test is self._current_test:
+            self.test_details[self._current_test_name]["duration"] = (end_ns - self._current_start_ns) / 1e9
+            self._current_test = None
     
-    def add_success(self, test):
+    def addSuccess(self, test):
         """Called when a test passes"""
         self.tests_run += 1
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
-        self.successes.append(test_name)
-        if test_name in self.test_details:
-            self.test_details[test_name]["status"] = "PASS"
+        test_name = self._test_name(test)
+        self.successes += 1
+        if self.success_names is not None:
+            self.success_names.append(test_name)
+        details = self.test_details.setdefault(test_name, {})
+        details["status"] = "PASS"
     
-    def add_error(self, test, err):
-        """Called when a test has an error"""
+    def addError(self, test, err):
+        """Called when a test, or a class or module fixture, has an error"""
         self.tests_run += 1
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
-        self.errors.append((test_name, err))
-        if test_name in self.test_details:
-            self.test_details[test_name]["status"] = "ERROR"
-            self.test_details[test_name]["error"] = str(err[1])
+        test_name = self._test_name(test)
+        self.error_count += 1
+        self.errors.append((test_name, _format_exception(err)))
+        details = self.test_details.setdefault(test_name, {})
+        details["status"] = "ERROR"
+        details["error"] = str(err[1])
     
-    def add_failure(self, test, err):
+    def addFailure(self, test, err):
         """Called when a test fails"""
         self.tests_run += 1
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
-        self.failures.append((test_name, err))
-        if test_name in self.test_details:
-            self.test_details[test_name]["status"] = "FAIL"
-            self.test_details[test_name]["failure"] = str(err[1])
+        test_name = self._test_name(test)
+        self.failure_count += 1
+        self.failures.append((test_name, _format_exception(err)))
+        details = self.test_details.setdefault(test_name, {})
+        details["status"] = "FAIL"
+        details["failure"] = str(err[1])
     
-    def add_skip(self, test, reason):
+    def addSkip(self, test, reason):
         """Called when a test is skipped"""
-        test_name = f"{test.__class__.__module__}.{test.__class__.__name__}.{test._testMethodName}"
+        test_name = self._test_name(test)
         self.skipped.append((test_name, reason))
-        if test_name in self.test_details:
-            self.test_details[test_name]["status"] = "SKIP"
-            self.test_details[test_name]["skip_reason"] = reason
+        details = self.test_details.setdefault(test_name, {})
+        details["status"] = "SKIP"
+        details["skip_reason"] = reason
+    
+    def addSubTest(self, test, subtest, err):
+        """Called when a subtest ends; a test is recorded once, for its first failing subtest"""
+        if err is None or "status" in self.test_details.get(self._test_name(test), {}):
+            return
+        if issubclass(err[0], test.failureException):
+            self.addFailure(test, err)
+        else:
+            self.addError(test, err)
 
 
 class ComprehensiveTestRunner:
     """Comprehensive test runner with detailed reporting"""
     
-    def __init__(self, verbosity=2):
+    def __init__(self, verbosity=2, capture_output=False):
         self.verbosity = verbosity
-        self.test_suites = {
-            "models": test_models,
-            "integration": test_integration,
-            "scenarios": test_scenarios,
-            "performance": test_performance
-        }
+        self.capture_output = capture_output
+        self.test_suites = dict(SUITE_MODULES)
         self.results = {}
         self.overall_start_time = None
         self.overall_end_time = None
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all test suites and return comprehensive results"""
-        print("=" * 80)
-        print("AI READINESS ASSESSMENT - COMPREHENSIVE TEST SUITE")
-        print("=" * 80)
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        print("\n".join([
+            "=" * 80,
+            "AI READINESS ASSESSMENT - COMPREHENSIVE TEST SUITE",
+            "=" * 80,
+            f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            ""
+        ]))
         
         self.overall_start_time = time.time()
         
-        # Run each test suite
-        for suite_name, test_module in self.test_suites.items():
-            print(f"Running {suite_name.upper()} tests...")
-            print("-" * 50)
+        # Run the independent suites in parallel, one worker process per suite
+        parallel_suites = {
+            suite_name: module_name
+            for suite_name, module_name in self.test_suites.items()
+            if suite_name not in SERIAL_SUITES
+        }
+        if parallel_suites:
+            print(f"Running {', '.join(name.upper() for name in parallel_suites)} tests in parallel...\n{'-' * 50}")
+            
+            # One worker per suite: the suites mostly wait on LLM calls and file I/O, so
+            # they overlap usefully even when there are fewer cores than suites
+            completed = {}
+            with ProcessPoolExecutor(max_workers=len(parallel_suites)) as executor:
+                futures = {
+                    executor.submit(
+                        _run_suite_worker, suite_name, module_name, self.verbosity, self.capture_output
+                    ): suite_name
+                    for suite_name, module_name in parallel_suites.items()
+                }
+                for future in as_completed(futures):
+                    suite_name = futures[future]
+                    try:
+                        suite_result = future.result()
+                    except Exception as e:
+                        suite_result = _suite_error_result(suite_name, e)
+                    completed[suite_name] = suite_result
+                    
+                    self._print_suite_summary(suite_name, suite_result)
+                    print()
+            
+            # Keep results in suite order regardless of completion order
+            for suite_name in parallel_suites:
+                self.results[suite_name] = completed[suite_name]
+        
+        # Run the timing-sensitive suites one at a time
+        for suite_name in SERIAL_SUITES:
+            if suite_name not in self.test_suites:
+                continue
+            print(f"Running {suite_name.upper()} tests...\n{'-' * 50}")
             
-            suite_result = self._run_test_suite(suite_name, test_module)
+            suite_result = self._run_test_suite(suite_name, self.test_suites[suite_name])
             self.results[suite_name] = suite_result
             
             self._print_suite_summary(suite_name, suite_result)
@@ -124,14 +237,14 @@ class ComprehensiveTestRunner:
         
         return overall_report
     
-    def _run_test_suite(self, suite_name: str, test_module) -> Dict[str, Any]:
-        """Run a specific test suite"""
-        # Capture stdout to get test output
-        old_stdout = sys.stdout
-        test_output = StringIO()
+    def _run_test_suite(self, suite_name: str, module_name: str) -> Dict[str, Any]:
+        """Run a specific test suite, importing its module on first use"""
+        # Only buffer test output when it is wanted in the report
+        test_output = StringIO() if self.capture_output else None
         
         try:
-            # Create test loader and suite
+            # Import the suite module, then create test loader and suite
+            test_module = importlib.import_module(module_name)
             loader = unittest.TestLoader()
             suite = loader.loadTestsFromModule(test_module)
             
@@ -141,29 +254,19 @@ class ComprehensiveTestRunner:
             # Run tests with custom result
             start_time = time.time()
             
-            # Temporarily redirect stdout if not verbose
-            if self.verbosity < 2:
-                sys.stdout = test_output
-            
-            # Run the test suite
-            for test_case in suite:
-                for test in test_case:
-                    result.start_test(test)
-                    try:
-                        test.debug()
-                        result.add_success(test)
-                    except AssertionError as e:
-                        result.add_failure(test, (type(e), e, None))
-                    except Exception as e:
-                        result.add_error(test, (type(e), e, None))
-                    finally:
-                        result.stop_test(test)
+            # Run the test suite, including its class and module fixtures;
+            # test output is captured or discarded when not verbose
+            if self.verbosity >= 2:
+                suite.run(result)
+            elif test_output is not None:
+                with redirect_stdout(test_output):
+                    suite.run(result)
+            else:
+                with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                    suite.run(result)
             
             end_time = time.time()
             
-            # Restore stdout
-            sys.stdout = old_stdout
-            
             # Compile results
             suite_result = {
                 "suite_name": suite_name,
@@ -171,31 +274,21 @@ class ComprehensiveTestRunner:
                 "end_time": end_time,
                 "duration": end_time - start_time,
                 "tests_run": result.tests_run,
-                "successes": len(result.successes),
-                "failures": len(result.failures),
-                "errors": len(result.errors),
+                "successes": result.successes,
+                "failures": result.failure_count,
+                "errors": result.error_count,
                 "skipped": len(result.skipped),
-                "success_rate": (len(result.successes) / result.tests_run * 100) if result.tests_run > 0 else 0,
+                "success_rate": (result.successes / result.tests_run * 100) if result.tests_run > 0 else 0,
                 "test_details": result.test_details,
-                "failure_details": result.failures,
-                "error_details": result.errors,
-                "output": test_output.getvalue()
+                "failure_details": list(result.failures),
+                "error_details": list(result.errors),
+                "output": test_output.getvalue() if test_output is not None else ""
             }
             
             return suite_result
             
         except Exception as e:
-            sys.stdout = old_stdout
-            return {
-                "suite_name": suite_name,
-                "error": f"Failed to run test suite: {str(e)}",
-                "tests_run": 0,
-                "successes": 0,
-                "failures": 0,
-                "errors": 1,
-                "skipped": 0,
-                "success_rate": 0
-            }
+            return _suite_error_result(suite_name, e)
     
     def _print_suite_summary(self, suite_name: str, result: Dict[str, Any]):
         """Print summary for a test suite"""
@@ -210,34 +303,41 @@ class ComprehensiveTestRunner:
         success_rate = result["success_rate"]
         duration = result["duration"]
         
-        status_icon = "✅" if success_rate >= 90 else "⚠️" if success_rate >= 70 else "❌"
+        status_icon = _SUITE_ICONS[_suite_status(success_rate)]
         
-        print(f"{status_icon} {suite_name.upper()} RESULTS:")
-        print(f"   Tests Run: {tests_run}")
-        print(f"   Passed: {successes}")
-        print(f"   Failed: {failures}")
-        print(f"   Errors: {errors}")
-        print(f"   Success Rate: {success_rate:.1f}%")
-        print(f"   Duration: {duration:.2f}s")
+        # Build the whole summary first so it is written to stdout in one go
+        lines = [
+            f"{status_icon} {suite_name.upper()} RESULTS:",
+            f"   Tests Run: {tests_run}",
+            f"   Passed: {successes}",
+            f"   Failed: {failures}",
+            f"   Errors: {errors}",
+            f"   Success Rate: {success_rate:.1f}%",
+            f"   Duration: {duration:.2f}s"
+        ]
         
         # Show failures and errors if any
         if failures > 0:
-            print(f"   ⚠️  Failures:")
-            for failure_name, failure_details in result["failure_details"][:3]:  # Show first 3
-                print(f"      - {failure_name.split('.')[-1]}")
+            lines.append("   ⚠️  Failures:")
+            for failure_name, failure_details in islice(result["failure_details"], _SUMMARY_DETAIL_LIMIT):
+                lines.append(f"      - {failure_name.split('.')[-1]}")
         
         if errors > 0:
-            print(f"   ❌ Errors:")
-            for error_name, error_details in result["error_details"][:3]:  # Show first 3
-                print(f"      - {error_name.split('.')[-1]}")
+            lines.append("   ❌ Errors:")
+            for error_name, error_details in islice(result["error_details"], _SUMMARY_DETAIL_LIMIT):
+                lines.append(f"      - {error_name.split('.')[-1]}")
+        
+        print("\n".join(lines))
     
     def _generate_overall_report(self) -> Dict[str, Any]:
         """Generate overall test report"""
-        total_tests = sum(result.get("tests_run", 0) for result in self.results.values())
-        total_successes = sum(result.get("successes", 0) for result in self.results.values())
-        total_failures = sum(result.get("failures", 0) for result in self.results.values())
-        total_errors = sum(result.get("errors", 0) for result in self.results.values())
-        total_skipped = sum(result.get("skipped", 0) for result in self.results.values())
+        total_tests = total_successes = total_failures = total_errors = total_skipped = 0
+        for result in self.results.values():
+            total_tests += result.get("tests_run", 0)
+            total_successes += result.get("successes", 0)
+            total_failures += result.get("failures", 0)
+            total_errors += result.get("errors", 0)
+            total_skipped += result.get("skipped", 0)
         
         overall_success_rate = (total_successes / total_tests * 100) if total_tests > 0 else 0
         total_duration = self.overall_end_time - self.overall_start_time
@@ -250,7 +350,7 @@ class ComprehensiveTestRunner:
                     "success_rate": result["success_rate"],
                     "duration": result["duration"],
                     "tests_run": result["tests_run"],
-                    "status": "PASS" if result["success_rate"] >= 90 else "WARN" if result["success_rate"] >= 70 else "FAIL"
+                    "status": _suite_status(result["success_rate"])
                 }
             else:
                 suite_metrics[suite_name] = {
@@ -276,54 +376,40 @@ class ComprehensiveTestRunner:
     
     def _determine_system_status(self, overall_success_rate: float, suite_metrics: Dict) -> str:
         """Determine overall system status based on test results"""
-        if overall_success_rate >= 95:
-            return "EXCELLENT"
-        elif overall_success_rate >= 85:
-            return "GOOD"
-        elif overall_success_rate >= 70:
-            return "ACCEPTABLE"
-        elif overall_success_rate >= 50:
-            return "NEEDS_IMPROVEMENT"
-        else:
-            return "CRITICAL"
+        return _SYSTEM_STATUSES[bisect_right(_SYSTEM_STATUS_THRESHOLDS, overall_success_rate)]
     
     def _print_overall_summary(self, report: Dict[str, Any]):
         """Print overall test summary"""
-        print("=" * 80)
-        print("OVERALL TEST RESULTS")
-        print("=" * 80)
-        
         status = report["system_status"]
-        status_icons = {
-            "EXCELLENT": "🟢",
-            "GOOD": "🟡",
-            "ACCEPTABLE": "🟠",
-            "NEEDS_IMPROVEMENT": "🔴",
-            "CRITICAL": "💀"
-        }
         
-        print(f"System Status: {status_icons.get(status, '❓')} {status}")
-        print(f"Overall Success Rate: {report['overall_success_rate']:.1f}%")
-        print(f"Total Tests: {report['total_tests']}")
-        print(f"Passed: {report['total_successes']}")
-        print(f"Failed: {report['total_failures']}")
-        print(f"Errors: {report['total_errors']}")
-        print(f"Total Duration: {report['total_duration']:.2f}s")
-        print()
-        
-        print("Suite Breakdown:")
+        # Build the whole summary first so it is written to stdout in one go
+        lines = [
+            "=" * 80,
+            "OVERALL TEST RESULTS",
+            "=" * 80,
+            f"System Status: {_STATUS_ICONS.get(status, '❓')} {status}",
+            f"Overall Success Rate: {report['overall_success_rate']:.1f}%",
+            f"Total Tests: {report['total_tests']}",
+            f"Passed: {report['total_successes']}",
+            f"Failed: {report['total_failures']}",
+            f"Errors: {report['total_errors']}",
+            f"Total Duration: {report['total_duration']:.2f}s",
+            "",
+            "Suite Breakdown:"
+        ]
         for suite_name, metrics in report["suite_metrics"].items():
-            status_icon = "✅" if metrics["status"] == "PASS" else "⚠️" if metrics["status"] == "WARN" else "❌"
-            print(f"  {status_icon} {suite_name.capitalize()}: {metrics['success_rate']:.1f}% ({metrics['tests_run']} tests)")
+            status_icon = _SUITE_ICONS[metrics["status"]]
+            lines.append(f"  {status_icon} {suite_name.capitalize()}: {metrics['success_rate']:.1f}% ({metrics['tests_run']} tests)")
         
-        print()
-        print("Recommendations:")
-        self._print_recommendations(report)
+        lines.append("")
+        lines.append("Recommendations:")
+        lines.extend(self._build_recommendations(report))
+        lines.append("=" * 80)
         
-        print("=" * 80)
+        print("\n".join(lines))
     
-    def _print_recommendations(self, report: Dict[str, Any]):
-        """Print recommendations based on test results"""
+    def _build_recommendations(self, report: Dict[str, Any]) -> List[str]:
+        """Build recommendation lines based on test results"""
         recommendations = []
         
         overall_rate = report["overall_success_rate"]
@@ -350,8 +436,7 @@ class ComprehensiveTestRunner:
             if perf_metrics["success_rate"] < 80:
                 recommendations.append("   - Performance optimization needed")
         
-        for rec in recommendations:
-            print(rec)
+        return recommendations
     
     def save_report(self, report: Dict[str, Any], filename: str = None):
         """Save test report to file"""
@@ -361,12 +446,32 @@ class ComprehensiveTestRunner:
         
         try:
             with open(filename, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+                f.write(json_dumps(report, indent=True, default=str))
             print(f"📄 Test report saved to: {filename}")
         except Exception as e:
             print(f"❌ Failed to save report: {str(e)}")
 
 
+def _suite_error_result(suite_name: str, error: Exception) -> Dict[str, Any]:
+    """Result entry for a suite that could not be run"""
+    return {
+        "suite_name": suite_name,
+        "error": f"Failed to run test suite: {str(error)}",
+        "tests_run": 0,
+        "successes": 0,
+        "failures": 0,
+        "errors": 1,
+        "skipped": 0,
+        "success_rate": 0
+    }
+
+
+def _run_suite_worker(suite_name: str, module_name: str, verbosity: int, capture_output: bool) -> Dict[str, Any]:
+    """Run one test suite in a worker process, importing its module there by name"""
+    runner = ComprehensiveTestRunner(verbosity=verbosity, capture_output=capture_output)
+    return runner._run_test_suite(suite_name, module_name)
+
+
 def run_specific_suite(suite_name: str):
     """Run a specific test suite"""
     runner = ComprehensiveTestRunner(verbosity=2)
@@ -377,8 +482,7 @@ def run_specific_suite(suite_name: str):
         return
     
     print(f"Running {suite_name} test suite...")
-    test_module = runner.test_suites[suite_name]
-    result = runner._run_test_suite(suite_name, test_module)
+    result = runner._run_test_suite(suite_name, runner.test_suites[suite_name])
     runner._print_suite_summary(suite_name, result)
 
 
@@ -388,9 +492,11 @@ def main():
     
     parser = argparse.ArgumentParser(description="AI Readiness Assessment Test Runner")
     parser.add_argument("--suite", help="Run specific test suite", 
-                       choices=["models", "integration", "scenarios", "performance"])
+                       choices=list(SUITE_MODULES))
     parser.add_argument("--save-report", help="Save detailed report to file", action="store_true")
     parser.add_argument("--verbose", "-v", help="Verbose output", action="store_true")
+    parser.add_argument("--capture-output", help="Keep test output in the saved report instead of discarding it",
+                       action="store_true")
     
     args = parser.parse_args()
     
@@ -398,7 +504,7 @@ def main():
         run_specific_suite(args.suite)
     else:
         # Run all tests
-        runner = ComprehensiveTestRunner(verbosity=2 if args.verbose else 1)
+        runner = ComprehensiveTestRunner(verbosity=2 if args.verbose else 1, capture_output=args.capture_output)
         report = runner.run_all_tests()
         
         if args.save_report:
@@ -4,11 +4,18 @@ These tools handle assessment operations like starting, saving, scoring, and pro
 """
 
 import json
+import os
+from bisect import bisect_left
+import time
+import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from langchain_core.tools import tool
 
+from .json_utils import json_dumps, json_loads
 from .models import AssessmentState, SectionScore, Recommendation
+from .persistence import AssessmentPersistence
 from .content import AssessmentContent
 from .validation import validate_assessment_data, validate_business_name, validate_industry
 
@@ -16,6 +23,59 @@ from .validation import validate_assessment_data, validate_business_name, valida
 # Global content instance for tools
 _content = AssessmentContent()
 
+# Tool results are consumed by agents and the API, so they are emitted as compact
+# JSON; set to True to get indented output when debugging
+PRETTY_OUTPUT = False
+
+# Upper bound (inclusive) of each readiness level's total score, and the levels in
+# the same order; totals above the last bound are AI Advanced
+_READINESS_THRESHOLDS = (40, 60, 75, 85)
+_READINESS_LEVELS = (
+    ("🔴 Not Ready", "Significant foundational work needed before AI implementation"),
+    ("🟡 Foundation Building", "Some readiness exists but key gaps need addressing"),
+    ("🟠 Ready for Pilots", "Good foundation for starting AI implementation"),
+    ("🟢 AI Ready", "Strong readiness for comprehensive AI implementation"),
+    ("🔵 AI Advanced", "Excellent readiness for cutting-edge AI implementation")
+)
+
+
+@lru_cache(maxsize=1)
+def _section_summary() -> Dict[str, Any]:
+    """Summary of the assessment sections; the content is static, so it is built once"""
+    return _content.get_section_summary()
+
+
+@lru_cache(maxsize=1)
+def _persistence() -> AssessmentPersistence:
+    """Shared persistence store, created on first use so importing the tools has no filesystem side effects"""
+    return AssessmentPersistence()
+
+
+# (epoch second, ISO string) for the last timestamp handed out by _now_iso
+_timestamp_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string at one-second resolution, formatted once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, text)
+    return text
+
+
+def _write_file(path, data: bytes) -> None:
+    """Write bytes to a file with raw os calls, skipping the text-mode file object"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 @tool
 def start_assessment(user_id: str, business_name: str, industry: str) -> str:
@@ -30,22 +90,20 @@ def start_assessment(user_id: str, business_name: str, industry: str) -> str:
     Returns:
         JSON string with assessment initialization status and details
     """
-    import uuid
-    from .persistence import AssessmentPersistence
     try:
         # Validate inputs
         is_valid, error = validate_business_name(business_name)
         if not is_valid:
-            return json.dumps({"success": False, "error": f"Invalid business name: {error}"})
+            return json_dumps({"success": False, "error": f"Invalid business name: {error}"})
 
         is_valid, canonical_or_error = validate_industry(industry)
         if not is_valid:
-            return json.dumps({"success": False, "error": f"Invalid industry: {canonical_or_error}"})
+            return json_dumps({"success": False, "error": f"Invalid industry: {canonical_or_error}"})
 
         canonical_industry = canonical_or_error
 
         # Generate a unique assessment_id
-        assessment_id = str(uuid.uuid4())
+        assessment_id = uuid.uuid4().hex
 
         # Create new assessment state
         assessment = AssessmentState(
@@ -56,11 +114,10 @@ def start_assessment(user_id: str, business_name: str, industry: str) -> str:
         )
 
         # Persist assessment state
-        persistence = AssessmentPersistence()
-        persistence.get_assessment_path(assessment_id).write_text(assessment.model_dump_json())
+        _write_file(_persistence().get_assessment_path(assessment_id), assessment.model_dump_json().encode())
 
         # Get assessment overview
-        summary = _content.get_section_summary()
+        summary = _section_summary()
 
         result = {
             "success": True,
@@ -79,10 +136,10 @@ def start_assessment(user_id: str, business_name: str, industry: str) -> str:
             "progress": 0.0
         }
 
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
 
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to start assessment: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to start assessment: {str(e)}"})
 
 
 @tool
@@ -99,7 +156,7 @@ def get_section_questions(section_id: str) -> str:
     try:
         section = _content.get_section(section_id)
         if not section:
-            return json.dumps({"success": False, "error": f"Section {section_id} not found"})
+            return json_dumps({"success": False, "error": f"Section {section_id} not found"})
         
         questions_data = []
         for question in section.questions:
@@ -122,10 +179,10 @@ def get_section_questions(section_id: str) -> str:
             "questions": questions_data
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to get section questions: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to get section questions: {str(e)}"})
 
 
 @tool
@@ -143,24 +200,25 @@ def submit_section_responses(section_id: str, responses: str) -> str:
     try:
         # Parse responses
         try:
-            response_dict = json.loads(responses)
+            response_dict = json_loads(responses)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for responses"})
+            return json_dumps({"success": False, "error": "Invalid JSON format for responses"})
         
-        # Convert string keys to proper format and validate scores
-        processed_responses = {}
-        for key, value in response_dict.items():
-            if not isinstance(value, int):
-                return json.dumps({"success": False, "error": f"Score for question {key} must be an integer, got {type(value).__name__}"})
-            processed_responses[str(key)] = int(value)
+        # Validate scores in one pass; the offending question is only looked up on failure
+        if not all(isinstance(value, int) for value in response_dict.values()):
+            key, value = next((key, value) for key, value in response_dict.items() if not isinstance(value, int))
+            return json_dumps({"success": False, "error": f"Score for question {key} must be an integer, got {type(value).__name__}"})
+        
+        # JSON object keys are already strings and every value was checked above
+        processed_responses = response_dict
         
         # Validate responses
         is_valid, errors = _content.validate_section_responses(section_id, processed_responses)
         if not is_valid:
-            return json.dumps({"success": False, "error": "Validation failed", "errors": errors})
+            return json_dumps({"success": False, "error": "Validation failed", "errors": errors})
         
         # Create section score
-        section_score = _content.create_section_score(section_id, processed_responses)
+        section_score = _content.create_section_score(section_id, processed_responses, validate=False)
         section = _content.get_section(section_id)
         
         # Calculate percentage
@@ -180,10 +238,10 @@ def submit_section_responses(section_id: str, responses: str) -> str:
             }
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to submit section responses: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to submit section responses: {str(e)}"})
 
 
 @tool
@@ -200,18 +258,20 @@ def calculate_total_score(section_scores: str) -> str:
     try:
         # Parse section scores
         try:
-            scores_dict = json.loads(section_scores)
+            scores_dict = json_loads(section_scores)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for section scores"})
+            return json_dumps({"success": False, "error": "Invalid JSON format for section scores"})
         
         total_score = 0
         total_possible = 0
         section_details = []
+        add_detail = section_details.append
+        get_section = _content.get_section
         
         # Calculate totals
         for section_id, score_data in scores_dict.items():
             if not isinstance(score_data, dict) or "section_total" not in score_data or "max_possible" not in score_data:
-                return json.dumps({"success": False, "error": f"Invalid score data for section {section_id}"})
+                return json_dumps({"success": False, "error": f"Invalid score data for section {section_id}"})
             
             section_total = score_data["section_total"]
             section_max = score_data["max_possible"]
@@ -219,31 +279,16 @@ def calculate_total_score(section_scores: str) -> str:
             total_score += section_total
             total_possible += section_max
             
-            section = _content.get_section(section_id)
-            section_details.append({
+            add_detail({
                 "section_id": section_id,
-                "section_name": section.name if section else "Unknown",
+                "section_name": getattr(get_section(section_id), "name", "Unknown"),
                 "score": section_total,
                 "max_possible": section_max,
                 "percentage": round((section_total / section_max) * 100, 1) if section_max > 0 else 0
             })
         
         # Determine readiness level
-        if total_score <= 40:
-            readiness_level = "🔴 Not Ready"
-            readiness_description = "Significant foundational work needed before AI implementation"
-        elif total_score <= 60:
-            readiness_level = "🟡 Foundation Building"
-            readiness_description = "Some readiness exists but key gaps need addressing"
-        elif total_score <= 75:
-            readiness_level = "🟠 Ready for Pilots"
-            readiness_description = "Good foundation for starting AI implementation"
-        elif total_score <= 85:
-            readiness_level = "🟢 AI Ready"
-            readiness_description = "Strong readiness for comprehensive AI implementation"
-        else:
-            readiness_level = "🔵 AI Advanced"
-            readiness_description = "Excellent readiness for cutting-edge AI implementation"
+        readiness_level, readiness_description = _READINESS_LEVELS[bisect_left(_READINESS_THRESHOLDS, total_score)]
         
         # Calculate overall percentage
         overall_percentage = (total_score / total_possible) * 100 if total_possible > 0 else 0
@@ -256,13 +301,13 @@ def calculate_total_score(section_scores: str) -> str:
             "readiness_level": readiness_level,
             "readiness_description": readiness_description,
             "section_breakdown": section_details,
-            "completed_at": datetime.now().isoformat()
+            "completed_at": _now_iso()
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to calculate total score: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to calculate total score: {str(e)}"})
 
 
 @tool
@@ -280,12 +325,12 @@ def save_assessment_progress(user_id: str, assessment_data: str) -> str:
     try:
         # Parse assessment data
         try:
-            data = json.loads(assessment_data)
+            data = json_loads(assessment_data)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for assessment data"})
+            return json_dumps({"success": False, "error": "Invalid JSON format for assessment data"})
         
         # Add metadata
-        data["last_saved"] = datetime.now().isoformat()
+        data["last_saved"] = _now_iso()
         data["user_id"] = user_id
         
         # Save to virtual file system (this will be handled by Deep Agents)
@@ -299,10 +344,10 @@ def save_assessment_progress(user_id: str, assessment_data: str) -> str:
             "user_id": user_id
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to save assessment progress: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to save assessment progress: {str(e)}"})
 
 
 @tool
@@ -329,10 +374,10 @@ def load_assessment_progress(user_id: str) -> str:
             "note": "This tool requires integration with Deep Agents virtual file system"
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to load assessment progress: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to load assessment progress: {str(e)}"})
 
 
 @tool
@@ -344,7 +389,7 @@ def get_assessment_summary() -> str:
         JSON string with assessment overview
     """
     try:
-        summary = _content.get_section_summary()
+        summary = _section_summary()
         
         result = {
             "success": True,
@@ -366,10 +411,10 @@ def get_assessment_summary() -> str:
             ]
         }
         
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to get assessment summary: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to get assessment summary: {str(e)}"})
 
 
 @tool
@@ -386,23 +431,28 @@ def calculate_section_progress(completed_sections: str) -> str:
     try:
         # Parse completed sections
         try:
-            completed = json.loads(completed_sections)
+            completed = json_loads(completed_sections)
         except json.JSONDecodeError:
-            return json.dumps({"success": False, "error": "Invalid JSON format for completed sections"})
+            return json_dumps({"success": False, "error": "Invalid JSON format for completed sections"})
         
         if not isinstance(completed, list):
-            return json.dumps({"success": False, "error": "Completed sections must be a list"})
+            return json_dumps({"success": False, "error": "Completed sections must be a list"})
         
-        total_sections = len(_content.get_all_sections())
+        sections = _content.get_all_sections()
+        total_sections = len(sections)
         completed_count = len(completed)
         
         # Calculate progress
         progress_percentage = (completed_count / total_sections) * 100 if total_sections > 0 else 0
         
-        # Get section details
+        # Section ids are strings, so other JSON values can never match one
+        completed_ids = frozenset(item for item in completed if isinstance(item, str))
+        
+        # Get section details and the next incomplete section in one pass
         section_status = []
-        for section in _content.get_all_sections():
-            is_completed = section.id in completed
+        next_section = None
+        for section in sections:
+            is_completed = section.id in completed_ids
             section_status.append({
                 "section_id": section.id,
                 "section_name": section.name,
@@ -410,6 +460,13 @@ def calculate_section_progress(completed_sections: str) -> str:
                 "questions": len(section.questions),
                 "max_points": section.max_points
             })
+            if next_section is None and not is_completed:
+                next_section = {
+                    "section_id": section.id,
+                    "section_name": section.name,
+                    "questions": len(section.questions),
+                    "max_points": section.max_points
+                }
         
         result = {
             "success": True,
@@ -420,28 +477,17 @@ def calculate_section_progress(completed_sections: str) -> str:
                 "is_complete": completed_count == total_sections
             },
             "section_status": section_status,
-            "next_section": None
+            "next_section": next_section
         }
         
-        # Find next incomplete section
-        for section in _content.get_all_sections():
-            if section.id not in completed:
-                result["next_section"] = {
-                    "section_id": section.id,
-                    "section_name": section.name,
-                    "questions": len(section.questions),
-                    "max_points": section.max_points
-                }
-                break
-        
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=PRETTY_OUTPUT)
         
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to calculate section progress: {str(e)}"})
+        return json_dumps({"success": False, "error": f"Failed to calculate section progress: {str(e)}"})
 
 
 # Export all tools for easy import
-ASSESSMENT_TOOLS = [
+ASSESSMENT_TOOLS = (
     start_assessment,
     get_section_questions,
     submit_section_responses,
@@ -450,4 +496,4 @@ ASSESSMENT_TOOLS = [
     load_assessment_progress,
     get_assessment_summary,
     calculate_section_progress
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -5,6 +5,19 @@ Validation functions for assessment data
 from typing import Dict, Any, List, Tuple
 from .models import AssessmentState, SectionScore
 
+# Business name length bounds (the minimum applies after stripping whitespace)
+MIN_BUSINESS_NAME_LENGTH = 2
+MAX_BUSINESS_NAME_LENGTH = 100
+
+# Industries an assessment can be started for; matching is case-insensitive
+VALID_INDUSTRIES = (
+    "Agriculture", "Manufacturing", "Technology", "Finance", "Healthcare",
+    "Education", "Retail", "Transportation", "Construction", "Tourism",
+    "Energy", "Telecommunications", "Other"
+)
+_CANONICAL_INDUSTRIES = {industry.lower(): industry for industry in VALID_INDUSTRIES}
+_INDUSTRY_ERROR = f"Industry must be one of: {', '.join(VALID_INDUSTRIES)}"
+
 
 def validate_score(score: Any) -> Tuple[bool, str]:
     """
@@ -35,18 +48,23 @@ def validate_section_scores(questions: Dict[str, int]) -> Tuple[bool, List[str]]
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
-    
     if not questions:
-        errors.append("Section must have at least one question")
-        return False, errors
+        return False, ["Section must have at least one question"]
+    
+    # Most sections are valid, so check them inline before building any messages
+    for score in questions.values():
+        if not (isinstance(score, int) and 1 <= score <= 5):
+            break
+    else:
+        return True, []
     
+    errors = []
     for question_id, score in questions.items():
         is_valid, error_msg = validate_score(score)
         if not is_valid:
             errors.append(f"Question {question_id}: {error_msg}")
     
-    return len(errors) == 0, errors
+    return False, errors
 
 
 def validate_assessment_data(assessment_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -95,11 +113,11 @@ def validate_business_name(business_name: str) -> Tuple[bool, str]:
     if not isinstance(business_name, str):
         return False, "Business name must be a string"
     
-    if len(business_name.strip()) < 2:
-        return False, "Business name must be at least 2 characters long"
+    if len(business_name.strip()) < MIN_BUSINESS_NAME_LENGTH:
+        return False, f"Business name must be at least {MIN_BUSINESS_NAME_LENGTH} characters long"
     
-    if len(business_name) > 100:
-        return False, "Business name must be less than 100 characters"
+    if len(business_name) > MAX_BUSINESS_NAME_LENGTH:
+        return False, f"Business name must be less than {MAX_BUSINESS_NAME_LENGTH} characters"
     
     return True, ""
 
@@ -112,24 +130,13 @@ def validate_industry(industry: str) -> Tuple[bool, str]:
         industry: The industry to validate
         
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, canonical_industry_name or error_message)
     """
-    print(f"[DEBUG] validate_industry received: '{industry}' (type: {type(industry)})")
-    industry_clean = industry.strip().lower() if isinstance(industry, str) else industry
-    print(f"[DEBUG] validate_industry cleaned: '{industry_clean}'")
-    valid_industries = [
-        "Agriculture", "Manufacturing", "Technology", "Finance", "Healthcare",
-        "Education", "Retail", "Transportation", "Construction", "Tourism",
-        "Energy", "Telecommunications", "Other"
-    ]
-    valid_industries_lower = {v.lower(): v for v in valid_industries}
-
     if not isinstance(industry, str):
         return False, "Industry must be a string"
 
-    industry_clean = industry.strip().lower()
-    if industry_clean not in valid_industries_lower:
-        return False, f"Industry must be one of: {', '.join(valid_industries)}"
+    canonical = _CANONICAL_INDUSTRIES.get(industry.strip().lower())
+    if canonical is None:
+        return False, _INDUSTRY_ERROR
 
-    # Optionally, you could return the canonical industry name here if needed
-    return True, ""
\ No newline at end of file
+    return True, canonical
\ No newline at end of file
@@ -3,6 +3,7 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any
+from ai_readiness_assessment.json_utils import json_dumps, json_loads
 from ai_readiness_assessment.main_agent import orchestrate_assessment_flow
 
 app = FastAPI()
@@ -29,8 +30,17 @@ class AnswerPayload(BaseModel):
 
 
 
-import json
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+
+
+def _json_response(data: Dict[str, Any]) -> Response:
+    """JSON response encoded with json_dumps rather than JSONResponse's stdlib encoder"""
+    return Response(content=json_dumps(data), media_type="application/json")
+
+
+def _raw_json_response(result: str) -> Response:
+    """Pass a tool's JSON string straight through when the route does not change it"""
+    return Response(content=result, media_type="application/json")
 
 
 @app.post("/api/assessment/start")
@@ -39,13 +49,13 @@ def start_assessment(info: Dict[str, Any]):
         print(f"[DEBUG] FastAPI /api/assessment/start received: {info}")
         payload = {"business_info": info.get("business_info", {})}
         print(f"[DEBUG] Payload to orchestrator: {payload}")
-        result = orchestrate_assessment_flow.invoke({"action": "start_assessment", "data": json.dumps(payload)})
+        result = orchestrate_assessment_flow.invoke({"action": "start_assessment", "data": payload})
         # result is a JSON string, parse and return as JSON
-        result_data = json.loads(result)
+        result_data = json_loads(result)
         if not result_data.get("assessment_id"):
             # fallback: use business name or user_id as assessment_id if present
             result_data["assessment_id"] = result_data.get("user_id") or result_data.get("business_name")
-        return JSONResponse(content=result_data)
+        return _json_response(result_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -53,8 +63,7 @@ def start_assessment(info: Dict[str, Any]):
 def get_next_question(assessment_id: str):
     try:
         result = orchestrate_assessment_flow.invoke({"action": "get_next_question", "assessment_id": assessment_id})
-        result_data = json.loads(result)
-        return JSONResponse(content=result_data)
+        return _raw_json_response(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -68,11 +77,10 @@ def submit_answer(assessment_id: str, payload: AnswerPayload):
         }
         result = orchestrate_assessment_flow.invoke({
             "action": "submit_responses",
-            "data": json.dumps(transformed_data),
+            "data": transformed_data,
             "assessment_id": assessment_id
         })
-        result_data = json.loads(result)
-        return JSONResponse(content=result_data)
+        return _raw_json_response(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -93,14 +101,14 @@ def get_assessment_guidance(assessment_id: str, data: Dict[str, Any]):
         result = get_question_explanation.invoke({
             "question_id": question_id,
             "section": section,
-            "user_context": json.dumps({
+            "user_context": json_dumps({
                 "user_message": user_message,
                 "assessment_id": assessment_id
             })
         })
         
-        guidance_data = json.loads(result)
-        return JSONResponse(content=guidance_data)
+        guidance_data = json_loads(result)
+        return _json_response(guidance_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -108,7 +116,6 @@ def get_assessment_guidance(assessment_id: str, data: Dict[str, Any]):
 def get_results(assessment_id: str):
     try:
         result = orchestrate_assessment_flow.invoke({"action": "get_results", "assessment_id": assessment_id})
-        result_data = json.loads(result)
-        return JSONResponse(content=result_data)
+        return _raw_json_response(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))